@@ -0,0 +1,53 @@
+"""
+Compile .env into a Python module at deploy time.
+
+The generated module (src/infrastructure/config/env_compiled.py) is imported
+by the configuration at startup, so production never parses .env; Python's
+bytecode cache serves the values instead.
+
+Usage:
+    python scripts/compile_env.py [path/to/.env]
+"""
+import os
+import sys
+
+from dotenv import dotenv_values
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_PATH = os.path.join(ROOT_DIR, "src", "infrastructure", "config", "env_compiled.py")
+
+
+def compile_env(env_path: str, output_path: str = OUTPUT_PATH) -> int:
+    """
+    Write the variables of an .env file as a Python dict literal.
+
+    Args:
+        env_path: .env file to read
+        output_path: Module to generate
+
+    Returns:
+        Number of variables written
+    """
+    # Values stay strings, exactly as os.environ would hold them
+    values = {key: value for key, value in dotenv_values(env_path).items() if value is not None}
+
+    lines = [
+        f'"""Generated from {os.path.basename(env_path)} by scripts/compile_env.py - do not edit."""',
+        "ENV = {",
+        *(f"    {key!r}: {value!r}," for key, value in sorted(values.items())),
+        "}",
+        ""
+    ]
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+    return len(values)
+
+
+if __name__ == "__main__":
+    env_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT_DIR, ".env")
+    if not os.path.exists(env_file):
+        sys.exit(f"❌ {env_file} not found")
+
+    count = compile_env(env_file)
+    print(f"✅ {count} variables compiled into {OUTPUT_PATH}")
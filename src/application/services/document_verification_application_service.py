@@ -3,64 +3,81 @@ Document Verification Application Service - Application Layer
 Clean Architecture - Orchestrates document verification use cases
 """
 import logging
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional
 from datetime import datetime
 
-from ..use_cases.process_document_use_case import ProcessDocumentUseCase, ValidationResult
+from ..use_cases.process_document_use_case import (
+    ProcessDocumentUseCase, BatchContext, IStatusWriter, StatusWriteError, ERR_PROCESSING
+)
 from ..use_cases.receive_event_use_case import ReceiveEventUseCase
-from domain.entities.event import Event
 from domain.entities.user import User, EducationHistory
 from domain.repositories.event_repository import IEventRepository
 
+# Events are I/O bound (browser verification, backend call), so they run on threads
+DEFAULT_VERIFY_WORKERS = 8
+
 
 class DocumentVerificationStats:
-    """Statistics for document verification operations."""
+    """Statistics for document verification operations (safe to update from worker threads)."""
     
-    def __init__(self):
-        self.total_processed = 0
-        self.successful_verifications = 0
-        self.failed_verifications = 0
-        self.skipped_documents = 0
-        self.backend_updates = 0
-        self.failed_backend_updates = 0
+    __slots__ = ("_counts", "_lock")
     
-    def add_successful_verification(self) -> None:
-        """Record successful verification."""
-        self.successful_verifications += 1
-        self.total_processed += 1
+    COUNTERS = (
+        "successful_verifications",
+        "failed_verifications",
+        "skipped_documents",
+        "backend_updates",
+        "failed_backend_updates"
+    )
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = dict.fromkeys(self.COUNTERS, 0)
     
-    def add_failed_verification(self) -> None:
-        """Record failed verification."""
-        self.failed_verifications += 1
-        self.total_processed += 1
+    def bump(self, kind: str, n: int = 1) -> None:
+        """
+        Increment a counter.
+        
+        Args:
+            kind: One of COUNTERS
+            n: Amount to add
+        """
+        with self._lock:
+            self._counts[kind] += n
     
-    def add_skipped_document(self) -> None:
-        """Record skipped document."""
-        self.skipped_documents += 1
+    def __getattr__(self, name: str) -> int:
+        """Expose counters as attributes, e.g. stats.failed_verifications."""
+        try:
+            return self._counts[name]
+        except KeyError:
+            raise AttributeError(name) from None
     
-    def add_backend_update(self, success: bool) -> None:
-        """Record backend update attempt."""
-        if success:
-            self.backend_updates += 1
-        else:
-            self.failed_backend_updates += 1
+    @property
+    def total_processed(self) -> int:
+        """Number of verifications that ran (successful or failed)."""
+        return self._counts["successful_verifications"] + self._counts["failed_verifications"]
     
     def get_success_rate(self) -> float:
         """Get verification success rate."""
-        if self.total_processed == 0:
+        total_processed = self.total_processed
+        if total_processed == 0:
             return 0.0
-        return (self.successful_verifications / self.total_processed) * 100
+        return (self._counts["successful_verifications"] / total_processed) * 100
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        with self._lock:
+            counts = dict(self._counts)
+        
+        total_processed = counts["successful_verifications"] + counts["failed_verifications"]
+        success_rate = (counts["successful_verifications"] / total_processed * 100) if total_processed else 0.0
+        
         return {
-            "total_processed": self.total_processed,
-            "successful_verifications": self.successful_verifications,
-            "failed_verifications": self.failed_verifications,
-            "skipped_documents": self.skipped_documents,
-            "backend_updates": self.backend_updates,
-            "failed_backend_updates": self.failed_backend_updates,
-            "success_rate": f"{self.get_success_rate():.1f}%"
+            "total_processed": total_processed,
+            **counts,
+            "success_rate": f"{success_rate:.1f}%"
         }
 
 
@@ -77,15 +94,32 @@ class DocumentVerificationApplicationService:
         self,
         event_repository: IEventRepository,
         receive_event_use_case: ReceiveEventUseCase,
-        process_document_use_case: ProcessDocumentUseCase
+        process_document_use_case: ProcessDocumentUseCase,
+        max_workers: int = DEFAULT_VERIFY_WORKERS,
+        write_queue: Optional[IStatusWriter] = None
     ):
-        """Initialize with dependencies."""
+        """
+        Initialize with dependencies.
+        
+        Args:
+            event_repository: Event persistence
+            receive_event_use_case: Creates events from raw data
+            process_document_use_case: Verifies a single event
+            max_workers: Number of events processed in parallel
+            write_queue: Write queue used by the use case, flushed after each batch
+        """
         self._event_repository = event_repository
         self._receive_event_use_case = receive_event_use_case
         self._process_document_use_case = process_document_use_case
+        self._max_workers = max(1, max_workers)
+        self._write_queue = write_queue
         self.logger = logging.getLogger(__name__)
     
-    def process_verification_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def process_verification_event(
+        self, 
+        event_data: Dict[str, Any], 
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process a single verification event.
         
@@ -93,23 +127,17 @@ class DocumentVerificationApplicationService:
         
         Args:
             event_data: Raw event data
+            timestamp: ISO timestamp for the result (current time if None);
+                       batch callers pass one shared value
             
         Returns:
             Processing result dictionary
         """
         try:
-            self.logger.info(f"🎯 Processing verification event")
+            self.logger.info("🎯 Processing verification event")
             
-            # Validate event data
-            validation_error = self._validate_event_data(event_data)
-            if validation_error:
-                return {
-                    "success": False,
-                    "message": f"Event validation failed: {validation_error}",
-                    "error_code": "VALIDATION_ERROR"
-                }
-            
-            # Create event from data
+            # Create event from data (the use case validates its structure,
+            # the value objects validate identity and document numbers)
             receive_result = self._receive_event_use_case.execute(event_data)
             if not receive_result.success:
                 return {
@@ -118,8 +146,8 @@ class DocumentVerificationApplicationService:
                     "error_code": receive_result.error_code
                 }
             
-            # Get the created event
-            event = self._event_repository.find_by_id(receive_result.event_id)
+            # The saved event comes back with the result, no need to read it again
+            event = receive_result.event
             if not event:
                 return {
                     "success": False,
@@ -138,7 +166,7 @@ class DocumentVerificationApplicationService:
                     "message": validation_result.message,
                     "files": validation_result.files
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or datetime.now().isoformat()
             }
             
         except Exception as e:
@@ -147,7 +175,7 @@ class DocumentVerificationApplicationService:
             return {
                 "success": False,
                 "message": error_msg,
-                "error_code": "PROCESSING_ERROR"
+                "error_code": ERR_PROCESSING
             }
     
     def process_user_documents(self, user: User) -> DocumentVerificationStats:
@@ -163,22 +191,34 @@ class DocumentVerificationApplicationService:
         stats = DocumentVerificationStats()
         
         try:
-            self.logger.info(f"👤 Processing documents for user: {user.user_id}")
+            self.logger.info("👤 Processing documents for user: %s", user.user_id)
             
             unverified_educations = user.get_unverified_educations()
+            batch_timestamp = datetime.now().isoformat()
             
             if not unverified_educations:
-                self.logger.info(f"📭 No unverified documents for user: {user.user_id}")
+                self.logger.info("📭 No unverified documents for user: %s", user.user_id)
                 return stats
             
-            for education in unverified_educations:
-                try:
-                    self._process_education_document(user, education, stats)
-                except Exception as e:
-                    self.logger.error(f"💥 Error processing education {education.id}: {str(e)}")
-                    stats.add_failed_verification()
+            max_workers = min(self._max_workers, len(unverified_educations))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="user-verify") as executor:
+                futures = {
+                    executor.submit(
+                        self._process_education_document, user, education, stats, batch_timestamp
+                    ): education
+                    for education in unverified_educations
+                }
+                
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.error(f"💥 Error processing education {futures[future].id}: {str(e)}")
+                        stats.bump("failed_verifications")
             
-            self.logger.info(f"📊 User processing completed: {stats.to_dict()}")
+            # to_dict() builds a snapshot under the stats lock, skip it when INFO is off
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("📊 User processing completed: %s", stats.to_dict())
             return stats
             
         except Exception as e:
@@ -196,9 +236,12 @@ class DocumentVerificationApplicationService:
             Batch processing result
         """
         try:
-            self.logger.info(f"🚀 Processing event batch (size: {batch_size})")
+            self.logger.info("🚀 Processing event batch (size: %s)", batch_size)
             
-            pending_events = self._event_repository.find_pending_events(limit=batch_size)
+            # Claiming marks the events as processing in one round trip, and
+            # concurrent batches never pick up the same events
+            pending_events = self._event_repository.claim_pending_events(limit=batch_size)
+            batch_timestamp = datetime.now().isoformat()
             
             if not pending_events:
                 return {
@@ -213,30 +256,54 @@ class DocumentVerificationApplicationService:
             successful_count = 0
             failed_count = 0
             
-            for event in pending_events:
-                try:
-                    result = self._process_document_use_case.execute(event)
+            # Backend notifications are collected and sent once the batch is done
+            batch_context = BatchContext()
+            
+            # Counters are only updated here, on the calling thread, as results arrive
+            max_workers = min(self._max_workers, len(pending_events))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-verify") as executor:
+                futures = {
+                    executor.submit(self._process_document_use_case.execute, event, batch_context): event
+                    for event in pending_events
+                }
+                
+                for future in as_completed(futures):
                     processed_count += 1
-                    
-                    if result.success:
-                        successful_count += 1
-                    else:
+                    try:
+                        if future.result().success:
+                            successful_count += 1
+                        else:
+                            failed_count += 1
+                            
+                    except Exception as e:
+                        self.logger.error(f"💥 Error processing event {futures[future].id}: {str(e)}")
                         failed_count += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"💥 Error processing event {event.id}: {str(e)}")
-                    failed_count += 1
-                    processed_count += 1
             
-            return {
+            # Make the batch's status updates visible before reporting it as done.
+            # The verifications ran either way, so the backend is always notified
+            status_write_error = None
+            try:
+                if self._write_queue is not None:
+                    self._write_queue.flush()
+            except StatusWriteError as e:
+                self.logger.error(f"💥 {e}")
+                status_write_error = str(e)
+            finally:
+                notified_count = self._process_document_use_case.notify_batch(batch_context)
+            
+            result = {
                 "success": True,
                 "message": f"Batch processing completed",
                 "processed_count": processed_count,
                 "successful_count": successful_count,
                 "failed_count": failed_count,
+                "notified_count": notified_count,
                 "success_rate": f"{(successful_count / processed_count * 100) if processed_count > 0 else 0:.1f}%",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": batch_timestamp
             }
+            if status_write_error:
+                result["status_write_error"] = status_write_error
+            return result
             
         except Exception as e:
             error_msg = f"Batch processing error: {str(e)}"
@@ -247,6 +314,43 @@ class DocumentVerificationApplicationService:
                 "error_code": "BATCH_PROCESSING_ERROR"
             }
     
+    def process_all_pending_events(self, batch_size: int = 10) -> Dict[str, Any]:
+        """
+        Process pending events batch by batch until none are left.
+        
+        Args:
+            batch_size: Events claimed per batch
+            
+        Returns:
+            Totals over all batches; "status_write_errors" lists failed
+            status flushes, and a failed batch stops the run with its error
+        """
+        totals = dict.fromkeys(
+            ("processed_count", "successful_count", "failed_count", "notified_count"), 0
+        )
+        status_write_errors = []
+        
+        while True:
+            result = self.process_batch_events(batch_size)
+            if not result["success"]:
+                return {**result, **totals, "status_write_errors": status_write_errors}
+            
+            for key in totals:
+                totals[key] += result.get(key, 0)
+            if "status_write_error" in result:
+                status_write_errors.append(result["status_write_error"])
+            
+            # A short batch means nothing was left to claim
+            if result["processed_count"] < batch_size:
+                break
+        
+        return {
+            "success": True,
+            "message": f"Processed {totals['processed_count']} events",
+            **totals,
+            "status_write_errors": status_write_errors
+        }
+    
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get current processing statistics."""
         try:
@@ -259,22 +363,23 @@ class DocumentVerificationApplicationService:
         self, 
         user: User, 
         education: EducationHistory, 
-        stats: DocumentVerificationStats
+        stats: DocumentVerificationStats,
+        timestamp: Optional[str] = None
     ) -> None:
         """Process a single education document."""
         try:
             # Skip if already verified
             if education.is_verified():
-                stats.add_skipped_document()
+                stats.bump("skipped_documents")
                 return
             
             # Validate document data
             if not education.document_number or len(education.document_number) < 3:
-                self.logger.warning(f"⚠️ Invalid document number for education {education.id}")
-                stats.add_skipped_document()
+                self.logger.warning("⚠️ Invalid document number for education %s", education.id)
+                stats.bump("skipped_documents")
                 return
             
-            self.logger.info(f"🔍 Processing education document: {education.id}")
+            self.logger.info("🔍 Processing education document: %s", education.id)
             
             # Create event data
             event_data = {
@@ -288,56 +393,21 @@ class DocumentVerificationApplicationService:
             }
             
             # Process the event
-            result = self.process_verification_event(event_data)
+            result = self.process_verification_event(event_data, timestamp)
             
             if result["success"]:
                 verification_result = result["verification_result"]
                 if verification_result["success"]:
                     education.mark_as_verified()
-                    stats.add_successful_verification()
+                    stats.bump("successful_verifications")
                 else:
                     education.mark_as_failed()
-                    stats.add_failed_verification()
+                    stats.bump("failed_verifications")
             else:
                 education.mark_as_failed()
-                stats.add_failed_verification()
+                stats.bump("failed_verifications")
                 
         except Exception as e:
             self.logger.error(f"💥 Education document processing error: {str(e)}")
             education.mark_as_failed()
-            stats.add_failed_verification()
-    
-    def _validate_event_data(self, event_data: Dict[str, Any]) -> str:
-        """
-        Validate event data structure.
-        
-        Args:
-            event_data: Event data to validate
-            
-        Returns:
-            Error message if validation fails, None if successful
-        """
-        required_fields = ["userId", "identityNumber", "eventType", "eventData"]
-        
-        for field in required_fields:
-            if field not in event_data:
-                return f"Missing required field: {field}"
-            
-            if not event_data[field]:
-                return f"Empty value for field: {field}"
-        
-        # Validate identity number
-        identity_number = event_data["identityNumber"]
-        if len(identity_number) != 11:
-            return f"Invalid identity number length: {len(identity_number)}"
-        
-        # Validate event data structure
-        event_data_obj = event_data["eventData"]
-        if "documentNumber" not in event_data_obj:
-            return "Missing documentNumber in eventData"
-        
-        document_number = event_data_obj["documentNumber"]
-        if len(document_number) < 3:
-            return f"Invalid document number: too short"
-        
-        return None 
\ No newline at end of file
+            stats.bump("failed_verifications")
@@ -0,0 +1,109 @@
+"""
+Repository Write Queue - Application Layer
+Clean Architecture - Batches event status writes off the processing path
+"""
+import logging
+import queue
+import threading
+from typing import Dict, List, Tuple
+
+from domain.entities.event import Event
+from domain.repositories.event_repository import IEventRepository
+from ..use_cases.process_document_use_case import StatusWriteError
+
+
+class RepositoryWriteQueue:
+    """
+    Write-behind queue for event status updates.
+
+    Single Responsibility: Only batches and flushes status writes
+    Processing threads submit events and continue immediately; a daemon
+    thread drains the queue and persists up to batch_flush_size events
+    with a single update_status_bulk call. If the bulk write fails, each
+    event is written on its own; events that still fail are reported by
+    the next flush().
+    """
+
+    def __init__(self, event_repository: IEventRepository, batch_flush_size: int = 50):
+        """
+        Initialize write queue and start its writer thread.
+
+        Args:
+            event_repository: Repository the writes are flushed to
+            batch_flush_size: Maximum number of events written per bulk update
+        """
+        self._event_repository = event_repository
+        self._batch_flush_size = max(1, batch_flush_size)
+        self._queue: "queue.Queue[Event]" = queue.Queue()
+        self._failures_lock = threading.Lock()
+        self._failures: List[Tuple[Event, Exception]] = []
+        self.logger = logging.getLogger(__name__)
+
+        self._writer = threading.Thread(target=self._run, name="repository-writer", daemon=True)
+        self._writer.start()
+
+    def submit(self, event: Event) -> None:
+        """
+        Queue an event status update.
+
+        Args:
+            event: Event whose current status should be persisted
+        """
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        """
+        Block until every update submitted so far has been written.
+
+        Raises:
+            StatusWriteError: If some updates could not be persisted since the last flush
+        """
+        self._queue.join()
+
+        with self._failures_lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise StatusWriteError(failures)
+
+    def _run(self) -> None:
+        """Writer thread: wait for an update, then drain whatever else is pending."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_flush_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: List[Event]) -> None:
+        """Persist a batch, keeping only the latest state of each event."""
+        # "processing" and the final status of one event often land in the same batch
+        latest: Dict[int, Event] = {}
+        for event in batch:
+            latest[event.id] = event
+
+        try:
+            self._event_repository.update_status_bulk(list(latest.values()))
+            self.logger.debug(f"💾 Flushed {len(latest)} event status updates")
+            return
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bulk status update failed for {len(latest)} events, writing one by one: {str(e)}")
+
+        # One bad row must not cost the rest of the batch their status
+        failures: List[Tuple[Event, Exception]] = []
+        for event in latest.values():
+            try:
+                self._event_repository.update_status(event)
+            except Exception as e:
+                self.logger.error(f"💥 Status update failed for event {event.id}: {str(e)}")
+                failures.append((event, e))
+
+        if failures:
+            with self._failures_lock:
+                self._failures.extend(failures)
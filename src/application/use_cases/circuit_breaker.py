@@ -0,0 +1,65 @@
+"""
+Circuit Breaker - Application Layer
+Clean Architecture - Stops calling an upstream service that keeps failing
+"""
+import threading
+import time
+from typing import Optional
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Single Responsibility: Only decides whether the upstream may be called
+    After failure_threshold consecutive failures the circuit opens and callers
+    fail fast. Once reset_timeout seconds have passed, one trial call is let
+    through; its outcome closes the circuit or keeps it open for another period.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to wait before letting a trial call through
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """
+        Check whether calls should be rejected.
+
+        Returns:
+            True while the circuit is open; False when closed or when the
+            caller has been chosen for the trial call
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: this caller makes the trial call, everyone else keeps failing fast
+                self._opened_at = time.monotonic()
+                return False
+
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a call that reached the upstream."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count an upstream failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
@@ -3,36 +3,58 @@ Process Document Use Case - Application Layer
 Clean Architecture - Business logic for document processing
 """
 import logging
-from datetime import datetime
-from typing import Protocol, List
-from abc import ABC, abstractmethod
+import threading
+from typing import Protocol, List, Optional, Sequence, Tuple
+from abc import abstractmethod
 
 from domain.entities.event import Event, EventStatus
 from domain.repositories.event_repository import IEventRepository
+from application.use_cases.verification_cache import VerificationCache
+from application.use_cases.circuit_breaker import CircuitBreaker
+
+# Error codes returned in ValidationResult.error_code
+ERR_VALIDATION_FAILED = "VALIDATION_FAILED"
+ERR_PROCESSING = "PROCESSING_ERROR"
+ERR_CIRCUIT_OPEN = "CIRCUIT_OPEN"
+ERR_INVALID_FORMAT = "INVALID_FORMAT"
+ERR_UPSTREAM_UNAVAILABLE = "UPSTREAM_UNAVAILABLE"
+ERR_VALIDATOR = "EDEVLET_ERROR"
+ERR_ADAPTER = "ADAPTER_ERROR"
+
+# Validator error codes meaning the upstream could not answer (as opposed to
+# a definitive "document invalid"), counted by the circuit breaker
+UPSTREAM_FAILURE_CODES = frozenset({ERR_UPSTREAM_UNAVAILABLE, ERR_ADAPTER})
+
+_CIRCUIT_OPEN_MESSAGE = "upstream unavailable"
+
+# Shared "no files" value, so failed results don't each allocate an empty list
+_NO_FILES: Tuple[str, ...] = ()
 
 
 class ValidationResult:
     """Result of document validation operation."""
     
+    __slots__ = ("success", "message", "files", "error_code")
+    
     def __init__(
         self,
         success: bool,
         message: str = None,
-        files: List[str] = None,
+        files: Sequence[str] = None,
         error_code: str = None
     ):
         self.success = success
         self.message = message
-        self.files = files or []
+        self.files = files if files is not None else _NO_FILES
         self.error_code = error_code
     
     @classmethod
-    def success_result(cls, message: str, files: List[str] = None):
+    def success_result(cls, message: str, files: Sequence[str] = None):
         """Create successful validation result."""
-        return cls(success=True, message=message, files=files or [])
+        return cls(success=True, message=message, files=files)
     
     @classmethod
-    def failure_result(cls, message: str, error_code: str = "VALIDATION_FAILED"):
+    def failure_result(cls, message: str, error_code: str = ERR_VALIDATION_FAILED):
         """Create failed validation result."""
         return cls(success=False, message=message, error_code=error_code)
 
@@ -59,10 +81,72 @@ class IBackendNotifier(Protocol):
     Dependency Inversion: High-level modules depend on this abstraction
     """
     
+    # Lets implementations that subclass the protocol declare __slots__
+    __slots__ = ()
+    
     @abstractmethod
     def notify_verification_result(self, event: Event, result: ValidationResult) -> bool:
         """Notify backend about verification result."""
         pass
+    
+    @abstractmethod
+    def notify_verification_results_bulk(self, pairs: List[Tuple[Event, ValidationResult]]) -> List[bool]:
+        """Notify backend about several verification results, returning one flag per pair."""
+        pass
+
+
+class StatusWriteError(Exception):
+    """Raised by IStatusWriter.flush() when status updates could not be persisted."""
+    
+    def __init__(self, failures: List[Tuple[Event, Exception]]):
+        super().__init__(
+            f"{len(failures)} event status updates could not be written: "
+            + ", ".join(f"{event.id} ({error})" for event, error in failures)
+        )
+        self.failures = failures
+
+
+class IStatusWriter(Protocol):
+    """
+    Event Status Writer Interface.
+    
+    Persists event status updates, possibly in the background
+    (implemented by application.services.RepositoryWriteQueue).
+    """
+    
+    @abstractmethod
+    def submit(self, event: Event) -> None:
+        """Queue an event status update."""
+        pass
+    
+    @abstractmethod
+    def flush(self) -> None:
+        """Block until every submitted update has been persisted (raises StatusWriteError if any failed)."""
+        pass
+
+
+class BatchContext:
+    """
+    Collects work deferred until a processing batch completes.
+    
+    Worker threads append to it concurrently; the batch owner drains it once
+    all events have been processed.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pending_notifications: List[Tuple[Event, ValidationResult]] = []
+    
+    def add_notification(self, event: Event, result: ValidationResult) -> None:
+        """Queue a backend notification for the end of the batch."""
+        with self._lock:
+            self.pending_notifications.append((event, result))
+    
+    def take_notifications(self) -> List[Tuple[Event, ValidationResult]]:
+        """Remove and return all queued notifications."""
+        with self._lock:
+            pending, self.pending_notifications = self.pending_notifications, []
+        return pending
 
 
 class ProcessDocumentUseCase:
@@ -78,15 +162,34 @@ class ProcessDocumentUseCase:
         self,
         event_repository: IEventRepository,
         document_validator: IDocumentValidator,
-        backend_notifier: IBackendNotifier
+        backend_notifier: IBackendNotifier,
+        verification_cache: Optional[VerificationCache] = None,
+        write_queue: Optional[IStatusWriter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ):
-        """Initialize with dependencies."""
+        """
+        Initialize with dependencies.
+        
+        Args:
+            event_repository: Event persistence
+            document_validator: External document validation
+            backend_notifier: Backend result notification
+            verification_cache: Reuses successful validations of the same
+                                document/identity pair (disabled if None)
+            write_queue: Persists status updates in the background
+                         (written synchronously if None)
+            circuit_breaker: Fails events fast while the validator's upstream
+                             keeps failing (default breaker if None)
+        """
         self._event_repository = event_repository
         self._document_validator = document_validator
         self._backend_notifier = backend_notifier
+        self._verification_cache = verification_cache
+        self._write_queue = write_queue
+        self._breaker = circuit_breaker or CircuitBreaker()
         self.logger = logging.getLogger(__name__)
     
-    def execute(self, event: Event) -> ValidationResult:
+    def execute(self, event: Event, batch_context: Optional[BatchContext] = None) -> ValidationResult:
         """
         Execute document processing use case.
         
@@ -99,42 +202,46 @@ class ProcessDocumentUseCase:
         
         Args:
             event: Event to process
+            batch_context: Defer the backend notification to notify_batch()
+                           (notified immediately if None)
             
         Returns:
             ValidationResult with processing outcome
         """
         try:
-            self.logger.info(f"⚙️ Processing event: {event.id}")
+            self.logger.info("⚙️ Processing event: %s", event.id)
             
-            # Business Rule: Mark event as processing
-            event.start_processing()
-            self._event_repository.update_status(event)
+            # Business Rule: Mark event as processing (claimed events already are)
+            if event.status != EventStatus.PROCESSING:
+                event.start_processing()
+                self._save_status(event)
             
             # Business Rule: Validate document
-            validation_result = self._document_validator.validate_document(
-                document_number=str(event.document_number),
-                identity_number=str(event.identity_number)
-            )
+            validation_result = self._validate(event)
             
             # Business Rule: Update event status based on validation
             if validation_result.success:
                 event.mark_as_processed()
-                self.logger.info(f"✅ Document validation successful for event: {event.id}")
+                self.logger.info("✅ Document validation successful for event: %s", event.id)
             else:
                 event.mark_as_failed(validation_result.message)
-                self.logger.warning(f"❌ Document validation failed for event: {event.id}")
+                self.logger.warning("❌ Document validation failed for event: %s", event.id)
             
-            self._event_repository.update_status(event)
+            self._save_status(event)
             
             # Business Rule: Notify backend
+            if batch_context is not None:
+                batch_context.add_notification(event, validation_result)
+                return validation_result
+            
             try:
                 notification_success = self._backend_notifier.notify_verification_result(
                     event, validation_result
                 )
                 if notification_success:
-                    self.logger.info(f"📡 Backend notified successfully for event: {event.id}")
+                    self.logger.info("📡 Backend notified successfully for event: %s", event.id)
                 else:
-                    self.logger.warning(f"⚠️ Backend notification failed for event: {event.id}")
+                    self.logger.warning("⚠️ Backend notification failed for event: %s", event.id)
             except Exception as e:
                 self.logger.error(f"💥 Backend notification error for event {event.id}: {str(e)}")
             
@@ -147,15 +254,78 @@ class ProcessDocumentUseCase:
             # Mark event as failed
             try:
                 event.mark_as_failed(error_msg)
-                self._event_repository.update_status(event)
+                self._save_status(event)
             except Exception as save_error:
                 self.logger.error(f"💥 Failed to save error state: {str(save_error)}")
             
             return ValidationResult.failure_result(
                 message=error_msg,
-                error_code="PROCESSING_ERROR"
+                error_code=ERR_PROCESSING
             )
     
+    def notify_batch(self, batch_context: BatchContext) -> int:
+        """
+        Send the backend notifications deferred during a batch in one bulk call.
+        
+        Args:
+            batch_context: Context passed to execute() for the batch's events
+            
+        Returns:
+            Number of successful notifications
+        """
+        pending = batch_context.take_notifications()
+        if not pending:
+            return 0
+        
+        try:
+            notified = sum(self._backend_notifier.notify_verification_results_bulk(pending))
+        except Exception as e:
+            self.logger.error(f"💥 Bulk backend notification error: {str(e)}")
+            return 0
+        
+        if notified < len(pending):
+            self.logger.warning("⚠️ Backend notified for %s of %s events", notified, len(pending))
+        else:
+            self.logger.info("📡 Backend notified for all %s events", notified)
+        return notified
+    
+    def _save_status(self, event: Event) -> None:
+        """Persist the event status, through the write queue when one is configured."""
+        if self._write_queue is None:
+            self._event_repository.update_status(event)
+        else:
+            self._write_queue.submit(event)
+    
+    def _validate(self, event: Event) -> ValidationResult:
+        """Validate the event's document, reusing a cached or in-flight result if possible."""
+        document_number = event.document_number.value if event.document_number else ""
+        identity_number = event.identity_number.value
+        
+        def validate() -> ValidationResult:
+            # Skip the validator (and its timeouts) while the upstream is down
+            if self._breaker.is_open():
+                return ValidationResult.failure_result(_CIRCUIT_OPEN_MESSAGE, ERR_CIRCUIT_OPEN)
+            
+            try:
+                result = self._document_validator.validate_document(
+                    document_number=document_number,
+                    identity_number=identity_number
+                )
+            except Exception:
+                self._breaker.record_failure()
+                raise
+            
+            if result.error_code in UPSTREAM_FAILURE_CODES:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            return result
+        
+        if self._verification_cache is None:
+            return validate()
+        
+        return self._verification_cache.get_or_verify(document_number, identity_number, validate)
+    
     def can_process_event(self, event: Event) -> bool:
         """
         Check if event can be processed.
@@ -4,7 +4,8 @@ Clean Architecture - Business logic for event reception
 """
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Optional
 
 from domain.entities.event import Event
 from domain.value_objects.event_type import EventType
@@ -12,10 +13,35 @@ from domain.value_objects.document_number import DocumentNumber
 from domain.value_objects.identity_number import IdentityNumber
 from domain.repositories.event_repository import IEventRepository
 
+# Top-level fields every incoming event must carry
+REQUIRED_EVENT_FIELDS = ('userId', 'identityNumber', 'eventType', 'eventData')
+_REQUIRED_EVENT_FIELD_SET = frozenset(REQUIRED_EVENT_FIELDS)
+
+# Error codes returned in EventReceivedResult.error_code
+ERR_VALIDATION = "VALIDATION_ERROR"
+ERR_INTERNAL = "INTERNAL_ERROR"
+ERR_MISSING_FIELD = "MISSING_REQUIRED_FIELD"
+ERR_EMPTY_FIELD = "EMPTY_REQUIRED_FIELD"
+ERR_MISSING_DOCUMENT_NUMBER = "MISSING_DOCUMENT_NUMBER"
+
+# Validation messages are built once, so rejecting a flood of bad events allocates nothing
+_MISSING_FIELD_MESSAGES = MappingProxyType(
+    {field: f"Missing required field: {field}" for field in REQUIRED_EVENT_FIELDS}
+)
+_EMPTY_FIELD_MESSAGES = MappingProxyType(
+    {field: f"Empty value for field: {field}" for field in REQUIRED_EVENT_FIELDS}
+)
+_MISSING_DOCUMENT_NUMBER_MESSAGE = "Missing documentNumber in eventData"
+
 
 class EventReceivedResult:
     """Result of event reception operation."""
     
+    __slots__ = (
+        "success", "event_id", "event", "error_message", "error_code", 
+        "timestamp", "_queue_stats", "_stats_fetcher"
+    )
+    
     def __init__(
         self,
         success: bool,
@@ -23,19 +49,43 @@ class EventReceivedResult:
         error_message: str = None,
         error_code: str = None,
         timestamp: datetime = None,
-        queue_stats: Dict[str, Any] = None
+        queue_stats: Dict[str, Any] = None,
+        event: Optional[Event] = None,
+        stats_fetcher: Optional[Callable[[], Dict[str, Any]]] = None
     ):
         self.success = success
         self.event_id = event_id
+        self.event = event
         self.error_message = error_message
         self.error_code = error_code
         self.timestamp = timestamp or datetime.now()
-        self.queue_stats = queue_stats or {}
+        self._queue_stats = queue_stats
+        self._stats_fetcher = stats_fetcher
+    
+    @property
+    def queue_stats(self) -> Dict[str, Any]:
+        """Queue statistics, fetched from the repository on first access."""
+        if self._queue_stats is None:
+            self._queue_stats = self._stats_fetcher() if self._stats_fetcher else {}
+            self._stats_fetcher = None
+        return self._queue_stats
     
     @classmethod
-    def success_result(cls, event_id: int, queue_stats: Dict[str, Any]):
-        """Create successful result."""
-        return cls(success=True, event_id=event_id, queue_stats=queue_stats)
+    def success_result(
+        cls, 
+        event_id: int, 
+        queue_stats: Optional[Dict[str, Any]] = None, 
+        event: Optional[Event] = None,
+        stats_fetcher: Optional[Callable[[], Dict[str, Any]]] = None
+    ):
+        """Create successful result (pass stats_fetcher to load queue_stats lazily)."""
+        return cls(
+            success=True, 
+            event_id=event_id, 
+            queue_stats=queue_stats, 
+            event=event, 
+            stats_fetcher=stats_fetcher
+        )
     
     @classmethod
     def failure_result(cls, error_message: str, error_code: str = "UNKNOWN_ERROR"):
@@ -64,7 +114,7 @@ class ReceiveEventUseCase:
         1. Validate event data structure
         2. Create domain entities with validation
         3. Save event to repository
-        4. Return result with queue statistics
+        4. Return result with (lazily loaded) queue statistics
         
         Args:
             event_data: Raw event data from external source
@@ -73,12 +123,12 @@ class ReceiveEventUseCase:
             EventReceivedResult with operation outcome
         """
         try:
-            self.logger.info(f"🎯 Executing receive event use case")
+            self.logger.info("🎯 Executing receive event use case")
             
             # Business Rule: Validate required fields
-            validation_result = self._validate_event_data(event_data)
-            if not validation_result.success:
-                return validation_result
+            validation_error = self._validate_event_data(event_data)
+            if validation_error:
+                return validation_error
             
             # Business Rule: Create domain entities
             event = self._create_event_entity(event_data)
@@ -86,42 +136,48 @@ class ReceiveEventUseCase:
             # Business Rule: Persist event
             saved_event = self._event_repository.save(event)
             
-            # Get updated queue statistics
-            queue_stats = self._event_repository.get_statistics()
-            
-            self.logger.info(f"✅ Event saved with ID: {saved_event.id}")
+            self.logger.info("✅ Event saved with ID: %s", saved_event.id)
             
+            # Queue statistics cost a query, so they are only loaded if the caller reads them
             return EventReceivedResult.success_result(
                 event_id=saved_event.id,
-                queue_stats=queue_stats
+                event=saved_event,
+                stats_fetcher=self._event_repository.get_statistics
             )
             
         except ValueError as e:
             error_msg = f"Validation error: {str(e)}"
-            self.logger.warning(f"⚠️ {error_msg}")
-            return EventReceivedResult.failure_result(error_msg, "VALIDATION_ERROR")
+            self.logger.warning("⚠️ %s", error_msg)
+            return EventReceivedResult.failure_result(error_msg, ERR_VALIDATION)
             
         except Exception as e:
             error_msg = f"Unexpected error in event reception: {str(e)}"
             self.logger.error(f"💥 {error_msg}")
-            return EventReceivedResult.failure_result(error_msg, "INTERNAL_ERROR")
+            return EventReceivedResult.failure_result(error_msg, ERR_INTERNAL)
     
-    def _validate_event_data(self, event_data: Dict[str, Any]) -> EventReceivedResult:
-        """Validate event data structure."""
-        required_fields = ['userId', 'identityNumber', 'eventType', 'eventData']
+    def _validate_event_data(self, event_data: Dict[str, Any]) -> Optional[EventReceivedResult]:
+        """
+        Validate event data structure.
         
-        for field in required_fields:
-            if field not in event_data:
-                error_msg = f"Missing required field: {field}"
-                return EventReceivedResult.failure_result(error_msg, "MISSING_REQUIRED_FIELD")
+        Returns:
+            Failure result if the structure is invalid, None otherwise
+        """
+        # All fields present and non-empty in a single C-level pass
+        if not all(map(event_data.get, REQUIRED_EVENT_FIELDS)):
+            missing = _REQUIRED_EVENT_FIELD_SET - event_data.keys()
+            if missing:
+                # Report in declaration order so the message is stable
+                field = min(missing, key=REQUIRED_EVENT_FIELDS.index)
+                return EventReceivedResult.failure_result(_MISSING_FIELD_MESSAGES[field], ERR_MISSING_FIELD)
+            
+            field = next(field for field in REQUIRED_EVENT_FIELDS if not event_data[field])
+            return EventReceivedResult.failure_result(_EMPTY_FIELD_MESSAGES[field], ERR_EMPTY_FIELD)
         
         # Validate eventData structure
-        event_data_obj = event_data.get('eventData', {})
-        if 'documentNumber' not in event_data_obj:
-            error_msg = "Missing documentNumber in eventData"
-            return EventReceivedResult.failure_result(error_msg, "MISSING_DOCUMENT_NUMBER")
+        if 'documentNumber' not in event_data['eventData']:
+            return EventReceivedResult.failure_result(_MISSING_DOCUMENT_NUMBER_MESSAGE, ERR_MISSING_DOCUMENT_NUMBER)
         
-        return EventReceivedResult.success_result(event_id=None, queue_stats={})
+        return None
     
     def _create_event_entity(self, event_data: Dict[str, Any]) -> Event:
         """Create Event domain entity from raw data."""
@@ -0,0 +1,131 @@
+"""
+Verification Cache - Application Layer
+Clean Architecture - Remembers successful document verifications
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from application.use_cases.process_document_use_case import ValidationResult
+
+
+class VerificationCache:
+    """
+    Bounded, time-limited cache of successful verification results.
+
+    Single Responsibility: Only decides whether a verification must run again
+    Concurrent requests for the same (document, identity) pair share a single
+    in-flight verification instead of each opening a browser session.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600):
+        """
+        Initialize verification cache.
+
+        Args:
+            maxsize: Maximum number of cached results (least recently used are evicted)
+            ttl: Seconds a successful result stays valid
+        """
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+
+        # key -> (expires_at, result), ordered from least to most recently used
+        self._entries: "OrderedDict[bytes, Tuple[float, ValidationResult]]" = OrderedDict()
+        self._in_flight: Dict[bytes, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(document_number: str, identity_number: str) -> bytes:
+        """Fixed-size key that keeps raw identity numbers out of memory dumps."""
+        return hashlib.blake2b(
+            f"{document_number}|{identity_number}".encode(), digest_size=16
+        ).digest()
+
+    def get_or_verify(
+        self,
+        document_number: str,
+        identity_number: str,
+        verify: Callable[[], "ValidationResult"]
+    ) -> "ValidationResult":
+        """
+        Return a cached result or run the verification once.
+
+        Args:
+            document_number: Document barcode number
+            identity_number: TC identity number
+            verify: Performs the actual verification
+
+        Returns:
+            Cached, shared in-flight or freshly computed ValidationResult
+        """
+        key = self.make_key(document_number, identity_number)
+
+        with self._lock:
+            cached = self._get_fresh(key)
+            if cached is not None:
+                return cached
+
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = verify()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            # Failures may be transient (site down, bad captcha), so only successes are kept
+            if result.success:
+                self._store(key, result)
+
+        future.set_result(result)
+        return result
+
+    def get(self, document_number: str, identity_number: str) -> Optional["ValidationResult"]:
+        """Cached result for a pair, or None if missing or expired."""
+        with self._lock:
+            return self._get_fresh(self.make_key(document_number, identity_number))
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get_fresh(self, key: bytes) -> Optional["ValidationResult"]:
+        """Look up a key, evicting it if expired (caller holds the lock)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return result
+
+    def _store(self, key: bytes, result: "ValidationResult") -> None:
+        """Insert a result and evict the least recently used entries (caller holds the lock)."""
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
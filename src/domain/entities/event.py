@@ -11,8 +11,13 @@ from ..value_objects.document_number import DocumentNumber
 from ..value_objects.identity_number import IdentityNumber
 
 
-class EventStatus(Enum):
-    """Event processing status enumeration."""
+class EventStatus(str, Enum):
+    """
+    Event processing status enumeration.
+    
+    Members are str instances, so they compare equal to the raw status strings
+    stored in the database without going through .value.
+    """
     NEW = "new"
     PROCESSING = "processing"
     PROCESSED = "processed"
@@ -183,7 +183,7 @@ class User:
         Returns:
             True if there are unverified documents
         """
-        return len(self.get_unverified_educations()) > 0
+        return any(edu.requires_verification() for edu in self.education_histories)
     
     def get_verification_summary(self) -> Dict[str, int]:
         """
@@ -192,11 +192,19 @@ class User:
         Returns:
             Dictionary with verification counts
         """
+        # One pass keyed by document_verified (True / False / None) instead of
+        # building three filtered lists just to count them
+        counts = {True: 0, False: 0, None: 0}
+        for edu in self.education_histories:
+            status = edu.document_verified
+            if status is None or type(status) is bool:
+                counts[status] += 1
+        
         return {
             "total": len(self.education_histories),
-            "verified": len(self.get_verified_educations()),
-            "failed": len(self.get_failed_educations()),
-            "pending": len(self.get_unverified_educations())
+            "verified": counts[True],
+            "failed": counts[False],
+            "pending": counts[None]
         }
     
     def update_security_info(self, security_data: Dict[str, Any]) -> None:
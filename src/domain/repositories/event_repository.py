@@ -4,7 +4,6 @@ Clean Architecture - Dependency Inversion Principle
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from datetime import datetime
 
 from ..entities.event import Event, EventStatus
 
@@ -60,6 +59,21 @@ class IEventRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def claim_pending_events(self, limit: int = 10) -> List[Event]:
+        """
+        Atomically move pending events to PROCESSING and return them.
+        
+        Concurrent callers never receive the same event.
+        
+        Args:
+            limit: Maximum number of events to claim
+            
+        Returns:
+            Claimed events, oldest first, already in PROCESSING status
+        """
+        pass
+    
     @abstractmethod
     def find_failed_events_for_retry(self, limit: int = 10) -> List[Event]:
         """
@@ -83,6 +97,16 @@ class IEventRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def update_status_bulk(self, events: List[Event]) -> None:
+        """
+        Update status and metadata of several events in one operation.
+        
+        Args:
+            events: Events with updated status
+        """
+        pass
+    
     @abstractmethod
     def count_by_status(self, status: EventStatus) -> int:
         """
@@ -5,7 +5,7 @@ import re
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentNumber:
     """
     Document Number Value Object.
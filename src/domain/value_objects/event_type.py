@@ -5,21 +5,25 @@ from enum import Enum
 from dataclasses import dataclass
 
 
-class EventTypeEnum(Enum):
-    """Event type enumeration."""
+class EventTypeEnum(str, Enum):
+    """Event type enumeration (members are str instances, comparable to raw values)."""
     USER_EDUCATION_CREATED = "UserEducationCreated"
     USER_SECURITY_CREATED = "UserSecurityCreated"
     USER_CV_CREATED = "UserCvCreated"
 
 
-@dataclass(frozen=True)
+# Membership check used by every EventType construction
+_VALID_EVENT_TYPES = frozenset(EventTypeEnum)
+
+
+@dataclass(frozen=True, slots=True)
 class EventType:
     """
     Event Type Value Object.
     
     Domain Rules:
     - Event type must be from supported types
-    - Value is immutable (frozen dataclass)
+    - Value is immutable (frozen, slotted dataclass)
     - Provides business logic for document type mapping
     """
     value: str
@@ -51,8 +55,7 @@ class EventType:
     
     def _is_valid_event_type(self) -> bool:
         """Check if event type is valid."""
-        valid_types = [e.value for e in EventTypeEnum]
-        return self.value in valid_types
+        return self.value in _VALID_EVENT_TYPES
     
     def get_document_type(self) -> str:
         """Get document type based on event type."""
@@ -67,12 +70,12 @@ class EventType:
     
     def is_education_event(self) -> bool:
         """Check if this is an education event."""
-        return self.value == EventTypeEnum.USER_EDUCATION_CREATED.value
+        return self.value == EventTypeEnum.USER_EDUCATION_CREATED
     
     def is_security_event(self) -> bool:
         """Check if this is a security event."""
-        return self.value == EventTypeEnum.USER_SECURITY_CREATED.value
+        return self.value == EventTypeEnum.USER_SECURITY_CREATED
     
     def is_cv_event(self) -> bool:
         """Check if this is a CV event."""
-        return self.value == EventTypeEnum.USER_CV_CREATED.value 
\ No newline at end of file
+        return self.value == EventTypeEnum.USER_CV_CREATED 
\ No newline at end of file
@@ -1,11 +1,10 @@
 """
 IdentityNumber Value Object - Domain Layer
 """
-import re
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdentityNumber:
     """
     TC Identity Number Value Object.
@@ -25,19 +24,14 @@ class IdentityNumber:
     
     def _is_valid_tc_number(self) -> bool:
         """Validate TC identity number using Turkish algorithm."""
-        if not self.value or len(self.value) != 11:
-            return False
-        
-        # Must be all digits
-        if not self.value.isdigit():
-            return False
+        value = self.value
         
-        # Cannot start with 0
-        if self.value[0] == '0':
+        # Exactly 11 digits, not starting with 0 (checked once, here)
+        if not value or len(value) != 11 or not value.isdigit() or value[0] == '0':
             return False
         
         # TC Kimlik No validation algorithm
-        digits = [int(d) for d in self.value]
+        digits = list(map(int, value))
         
         # Check sum of first 10 digits
         odd_sum = sum(digits[i] for i in range(0, 9, 2))  # 1st, 3rd, 5th, 7th, 9th
@@ -63,8 +57,7 @@ class IdentityNumber:
     
     def get_masked_value(self) -> str:
         """Get masked version for logging/display."""
-        if len(self.value) != 11:
-            return "***"
+        # Construction guarantees 11 digits, so no length check is needed
         return f"{self.value[:3]}****{self.value[7:]}"
     
     def __str__(self) -> str:
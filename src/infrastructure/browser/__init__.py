@@ -7,11 +7,13 @@ from .browser_factory import BrowserFactory
 from .human_behavior_simulator import HumanBehaviorSimulator
 from .strategy_factory import StrategyFactory, ElementStrategy
 from .element_finder import ElementFinder
+from .driver_pool import DriverPool
 
 __all__ = [
     'BrowserFactory',
     'HumanBehaviorSimulator', 
     'StrategyFactory',
     'ElementStrategy',
-    'ElementFinder'
+    'ElementFinder',
+    'DriverPool'
 ] 
\ No newline at end of file
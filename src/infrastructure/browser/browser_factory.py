@@ -2,26 +2,110 @@
 Browser Factory - Infrastructure Layer
 Clean Architecture - Advanced browser creation with anti-detection features
 """
+import functools
 import logging
 import os
 import random
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver import Chrome
+from selenium.webdriver.support.ui import WebDriverWait
 # from webdriver_manager.chrome import ChromeDriverManager
 import undetected_chromedriver as uc
 from fake_useragent import UserAgent
 import subprocess
 import re
-import ssl
-import platform
 
-# SSL sertifika doğrulama hatasını çözmek için
-if platform.system() == 'Darwin':  # macOS için
-    ssl._create_default_https_context = ssl._create_unverified_context
+from ..config.app_config import AppConfig
+
+
+@functools.cache
+def _configure_ssl_certificates() -> Optional[str]:
+    """
+    Point SSL_CERT_FILE at certifi's CA bundle on macOS (runs once).
+
+    Returns:
+        Path of the CA bundle in use, or None when nothing had to be configured
+    """
+    if not AppConfig.get_platform_config()["is_macos"]:
+        return None
+    
+    # SSL sertifika doğrulama hatasını çözmek için (macOS Python'unda sistem sertifikaları yok).
+    # Doğrulamayı kapatmak yerine certifi CA paketini kullan
+    if "SSL_CERT_FILE" not in os.environ:
+        import certifi
+        os.environ["SSL_CERT_FILE"] = certifi.where()
+    return os.environ["SSL_CERT_FILE"]
+
+# Minimal-feature flag set. The verification flow is a plain text form,
+# so images, extensions, sync and other background features are not needed
+_DEFAULT_FLAGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--hide-scrollbars",
+    "--disable-features=Translate,TranslateUI,MediaRouter,OptimizationHints,BackForwardCache",
+    "--blink-settings=imagesEnabled=false",
+)
+
+# Anti-detection flags added in stealth mode
+_STEALTH_FLAGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--disable-notifications",
+    "--disable-popup-blocking",
+    "--disable-save-password-bubble",
+    "--disable-web-security",
+    "--disable-ipc-flooding-protection",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-component-extensions-with-background-pages",
+    "--ignore-certificate-errors",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _chrome_args(
+    headless: bool,
+    window_size: str,
+    stealth_mode: bool,
+    extra_flags: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Build the Chrome command line shared by every browser with these settings.
+    
+    Args:
+        headless: Run without a window
+        window_size: "width,height" used in headless mode
+        stealth_mode: Include the anti-detection flags
+        extra_flags: Configured additional flags
+        
+    Returns:
+        Chrome arguments in launch order
+    """
+    if headless:
+        # New headless mode; size the window at launch instead of resizing it over WebDriver later
+        window_args = ("--headless=new", f"--window-size={window_size}")
+    else:
+        window_args = ("--start-maximized",)
+    
+    # Minimal-feature defaults plus any configured extra flags
+    args = window_args + _DEFAULT_FLAGS + tuple(extra_flags)
+    return args + _STEALTH_FLAGS if stealth_mode else args
+
+
+# Persistent HTTP cache per profile, so static assets survive browser restarts
+DISK_CACHE_SIZE = 128 * 1024 * 1024
 
 
 class BrowserFactory:
@@ -44,7 +128,8 @@ class BrowserFactory:
         stealth_mode: Optional[bool] = None,
         window_size: Optional[str] = None,
         timeout: Optional[int] = None,
-        use_undetected: Optional[bool] = None
+        use_undetected: Optional[bool] = None,
+        profile_dir: Optional[str] = None
     ) -> Chrome:
         """
         Create configured Chrome browser with anti-detection features.
@@ -56,12 +141,15 @@ class BrowserFactory:
             window_size: Browser window size (uses config default if None)
             timeout: Page load timeout (uses config default if None)
             use_undetected: Use undetected chrome (uses config default if None)
+            profile_dir: Persistent user data directory holding the disk cache
+                         (temporary profile if None; never share one between
+                         concurrently running browsers)
             
         Returns:
             Configured Chrome WebDriver instance
         """
-        from ...config.app_config import AppConfig
         browser_config = AppConfig.get_browser_config()
+        _configure_ssl_certificates()
         
         # Use provided values or fall back to config defaults
         headless = headless if headless is not None else browser_config["headless"]
@@ -81,7 +169,9 @@ class BrowserFactory:
             headless=headless,
             download_dir=download_path,
             stealth_mode=stealth_mode,
-            window_size=window_size
+            window_size=window_size,
+            extra_flags=browser_config["extra_flags"],
+            profile_dir=profile_dir
         )
         
         # Create Chrome service
@@ -96,11 +186,15 @@ class BrowserFactory:
                 )
             else:
                 self.logger.info("🌐 Creating standard Chrome browser...")
+                self._add_standard_driver_options(chrome_options, browser_config["use_pipe"])
                 driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Configure timeouts
             driver.set_page_load_timeout(timeout)
-            driver.implicitly_wait(10)
+            driver.implicitly_wait(browser_config["implicit_wait"])
+            
+            # Write downloads straight to the download directory
+            self._enable_downloads(driver, download_path)
             
             # Apply stealth configurations
             if stealth_mode:
@@ -124,26 +218,21 @@ class BrowserFactory:
         headless: bool,
         download_dir: str,
         stealth_mode: bool,
-        window_size: str
+        window_size: str,
+        extra_flags: Tuple[str, ...] = (),
+        profile_dir: Optional[str] = None
     ) -> Options:
         """Create Chrome options with advanced configurations."""
         chrome_options = Options()
         
-        # Basic options
-        if headless:
-            chrome_options.add_argument("--headless=new")  # New headless mode
-        
-        chrome_options.add_argument(f"--window-size={window_size}")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        
-        # Anti-detection options
-        if stealth_mode:
-            self._add_stealth_options(chrome_options)
+        # Window, default, extra and stealth flags are assembled once per setting combination
+        for arg in _chrome_args(headless, window_size, stealth_mode, tuple(extra_flags)):
+            chrome_options.add_argument(arg)
         
-        # Performance optimizations
-        self._add_performance_options(chrome_options)
+        if profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+            chrome_options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
         
         # Download preferences
         download_prefs = self._create_download_preferences(download_dir)
@@ -155,60 +244,19 @@ class BrowserFactory:
         
         return chrome_options
     
-    def _add_stealth_options(self, chrome_options: Options) -> None:
-        """Add stealth/anti-detection Chrome options."""
-        stealth_options = [
-            "--disable-blink-features=AutomationControlled",
-            "--disable-extensions",
-            "--disable-plugins",
-            "--disable-infobars",
-            "--disable-notifications",
-            "--disable-popup-blocking",
-            "--disable-save-password-bubble",
-            "--disable-translate",
-            "--disable-web-security",
-            "--disable-features=TranslateUI",
-            "--disable-ipc-flooding-protection",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-default-apps",
-            "--disable-background-timer-throttling",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-renderer-backgrounding",
-            "--disable-component-extensions-with-background-pages",
-            "--ignore-certificate-errors",
-            "--ignore-ssl-errors",
-            "--ignore-certificate-errors-spki-list",
-            "--ignore-certificate-errors-ssl"
-        ]
-        
-        for option in stealth_options:
-            chrome_options.add_argument(option)
-        
-        self.logger.debug(f"🥷 Added {len(stealth_options)} stealth options")
-    
-    def _add_performance_options(self, chrome_options: Options) -> None:
-        """Add performance optimization options."""
-        performance_options = [
-            "--disable-images",
-            "--disable-javascript",  # Only for document verification
-            "--disable-plugins",
-            "--disable-java",
-            "--disable-flash",
-            "--disable-background-networking",
-            "--disable-sync",
-            "--disable-translate",
-            "--hide-scrollbars",
-            "--mute-audio",
-            "--no-sandbox",
-            "--memory-pressure-off",
-            "--max_old_space_size=4096"
-        ]
+    def _add_standard_driver_options(self, chrome_options: Options, use_pipe: bool) -> None:
+        """
+        Add options only supported by plain chromedriver (undetected_chromedriver rejects them).
         
-        for option in performance_options:
-            chrome_options.add_argument(option)
+        Args:
+            chrome_options: Options to extend
+            use_pipe: Talk to DevTools over a pipe instead of a WebSocket
+        """
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         
-        self.logger.debug(f"⚡ Added {len(performance_options)} performance options")
+        if use_pipe:
+            chrome_options.add_argument("--remote-debugging-pipe")
+            self.logger.debug("🔌 DevTools pipe transport enabled")
     
     def _create_download_preferences(self, download_dir: str) -> Dict[str, Any]:
         """Create download preferences."""
@@ -240,6 +288,22 @@ class BrowserFactory:
             # return Service(ChromeDriverManager().install())
             raise
     
+    def _enable_downloads(self, driver: Chrome, download_dir: str) -> None:
+        """Allow downloads via CDP (headless Chrome ignores the download prefs)."""
+        try:
+            driver.execute_cdp_cmd("Page.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": download_dir
+            })
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": download_dir,
+                "eventsEnabled": True
+            })
+            self.logger.debug(f"📥 CDP download behavior set: {download_dir}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ CDP download configuration warning: {str(e)}")
+    
     def _apply_stealth_configurations(self, driver: Chrome) -> None:
         """Apply JavaScript-based stealth configurations."""
         try:
@@ -309,12 +373,8 @@ class BrowserFactory:
     
     def _ensure_download_directory(self) -> str:
         """Ensure download directory exists."""
-        download_dir = os.path.join(os.getcwd(), "downloads")
-        
-        if not os.path.exists(download_dir):
-            os.makedirs(download_dir)
-            self.logger.debug(f"📁 Created download directory: {download_dir}")
-        
+        download_dir = AppConfig.get_download_config()["storage_dir"]
+        os.makedirs(download_dir, exist_ok=True)
         return download_dir
     
     def create_headless_browser(self, **kwargs) -> Chrome:
@@ -348,10 +408,7 @@ class BrowserFactory:
                 uc_options.add_experimental_option(name, value)
             
             # Add undetected-specific optimizations
-            uc_options.add_argument("--disable-blink-features=AutomationControlled")
             uc_options.add_argument("--remote-allow-origins=*")
-            uc_options.add_argument("--enable-javascript")
-            uc_options.add_argument("--disable-dev-shm-usage")
             uc_options.add_argument("--disable-software-rasterizer")
             
             # Get Chrome version for better compatibility
@@ -378,9 +435,8 @@ class BrowserFactory:
                     use_subprocess=True
                 )
             
-            # Wait for browser to fully load
-            import time
-            time.sleep(3)
+            # Wait until the browser answers commands instead of sleeping a fixed interval
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(lambda d: d.window_handles)
             
             self.logger.info("✅ Undetected Chrome browser created successfully")
             return driver
@@ -395,20 +451,22 @@ class BrowserFactory:
     def _get_chrome_version(self) -> Optional[int]:
         """Get Chrome browser version."""
         try:
-            if platform.system() == 'Darwin':  # macOS
+            platform_config = AppConfig.get_platform_config()
+            
+            if platform_config["is_macos"]:  # macOS
                 result = subprocess.run(
                     ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'], 
-                    capture_output=True, text=True
+                    capture_output=True, text=True, timeout=5
                 )
-            elif platform.system() == 'Linux':
+            elif platform_config["is_linux"]:
                 result = subprocess.run(
                     ['google-chrome', '--version'], 
-                    capture_output=True, text=True
+                    capture_output=True, text=True, timeout=5
                 )
-            elif platform.system() == 'Windows':
+            elif platform_config["is_windows"]:
                 result = subprocess.run(
                     ['chrome.exe', '--version'], 
-                    capture_output=True, text=True
+                    capture_output=True, text=True, timeout=5
                 )
             else:
                 return None
@@ -0,0 +1,207 @@
+"""
+Driver Pool - Infrastructure Layer
+Clean Architecture - Keeps warm Chrome sessions around between verifications
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+from selenium.webdriver import Chrome
+
+
+class DriverPool:
+    """
+    Pool of pre-initialized Chrome drivers.
+
+    Single Responsibility: Only handles driver lifecycle (create, lend, reset, quit)
+    Starting Chrome and chromedriver costs seconds, so drivers are reused and
+    only reset between verifications.
+
+    Every live driver owns a numbered slot (1..size). A recycled driver's
+    replacement gets the freed number again, so per-slot resources such as
+    profile and download directories are reused instead of piling up.
+    """
+
+    def __init__(self, driver_factory: Callable[[int], Chrome], size: int = 1, max_uses: int = 0):
+        """
+        Initialize driver pool.
+
+        Args:
+            driver_factory: Callable that creates a new configured driver for a slot number
+            size: Maximum number of drivers kept alive at the same time
+            max_uses: Quit a driver after this many checkouts to bound
+                      Chrome's memory growth (0 disables recycling)
+        """
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self.max_uses = max(0, max_uses)
+        self.logger = logging.getLogger(__name__)
+
+        # Idle drivers and free slot numbers are guarded by one condition, so a
+        # checkout waits for either a returned driver or a slot freed by a quit
+        self._cond = threading.Condition()
+        self._idle: Deque[Chrome] = deque()
+        self._free_slots = list(range(1, self.size + 1))
+        # Every live driver, idle or checked out, by slot
+        self._slots: Dict[Chrome, int] = {}
+        self._uses: Dict[Chrome, int] = {}
+        self._closed = False
+
+    def warm_up(self, count: Optional[int] = None) -> None:
+        """
+        Pre-create drivers so the first verifications skip Chrome startup.
+
+        Args:
+            count: Number of drivers to create (fills the pool if None)
+        """
+        count = self.size if count is None else min(count, self.size)
+
+        while True:
+            with self._cond:
+                if self._closed or self.size - len(self._free_slots) >= count:
+                    break
+                slot = self._free_slots.pop(0)
+
+            self._put_idle(self._create(slot))
+
+        self.logger.info(f"🔥 Driver pool warmed up with {count} drivers")
+
+    def checkout(self, timeout: Optional[float] = None) -> Chrome:
+        """
+        Borrow a driver, creating one if the pool is not full yet.
+
+        Args:
+            timeout: Seconds to wait for a free driver (waits forever if None)
+
+        Returns:
+            Ready-to-use Chrome WebDriver instance
+
+        Raises:
+            RuntimeError: If the pool is shut down (also while waiting)
+            TimeoutError: If no driver became available within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._free_slots:
+                    slot = self._free_slots.pop(0)
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No driver available within {timeout}s")
+                self._cond.wait(remaining)
+
+        return self._create(slot)
+
+    def checkin(self, driver: Chrome, discard: bool = False) -> None:
+        """
+        Return a driver to the pool after clearing its browsing state.
+
+        Args:
+            driver: Driver obtained from checkout()
+            discard: Quit the driver instead of reusing it
+                     (always the case once the pool is shut down)
+        """
+        with self._cond:
+            if self._closed and driver not in self._slots:
+                # Already quit by shutdown()
+                return
+            uses = self._uses.get(driver, 0) + 1
+            self._uses[driver] = uses
+            closed = self._closed
+
+        if closed:
+            discard = True
+        elif not discard and self.max_uses and uses >= self.max_uses:
+            self.logger.info(f"♻️ Recycling driver after {uses} uses")
+            discard = True
+
+        if not discard:
+            try:
+                driver.get("about:blank")
+                # Session state goes, the HTTP cache stays warm for the next verification
+                driver.delete_all_cookies()
+            except Exception as e:
+                self.logger.warning(f"⚠️ Driver reset failed, discarding: {str(e)}")
+            else:
+                if self._put_idle(driver):
+                    return
+
+        self._quit(driver)
+
+    def slot_of(self, driver: Chrome) -> Optional[int]:
+        """Slot number owned by a live driver (None if unknown)."""
+        return self._slots.get(driver)
+
+    def shutdown(self) -> None:
+        """
+        Quit every driver the pool created, including checked-out ones.
+
+        Drivers checked in afterwards are quit instead of pooled, and threads
+        waiting in checkout() get a RuntimeError.
+        """
+        with self._cond:
+            self._closed = True
+            drivers = list(self._slots)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for driver in drivers:
+            self._quit(driver)
+
+        self.logger.info("🔄 Driver pool shut down")
+
+    def _put_idle(self, driver: Chrome) -> bool:
+        """Queue a driver for the next checkout (False if the pool is shut down)."""
+        with self._cond:
+            if self._closed:
+                return False
+            self._idle.append(driver)
+            self._cond.notify()
+        return True
+
+    def _create(self, slot: int) -> Chrome:
+        """Create a driver for a reserved slot, releasing the slot on failure."""
+        try:
+            driver = self.driver_factory(slot)
+        except Exception:
+            self._release(slot)
+            raise
+
+        with self._cond:
+            self._slots[driver] = slot
+            closed = self._closed
+
+        # shutdown() ran while Chrome was starting
+        if closed:
+            self._quit(driver)
+            raise RuntimeError("Driver pool is shut down")
+        return driver
+
+    def _release(self, slot: int) -> None:
+        """Make a slot number available again and wake a waiting checkout."""
+        with self._cond:
+            self._free_slots.append(slot)
+            self._free_slots.sort()
+            self._cond.notify()
+
+    def _quit(self, driver: Chrome) -> None:
+        """Quit a driver and release its pool slot."""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.error(f"💥 Driver quit error: {str(e)}")
+        finally:
+            with self._cond:
+                slot = self._slots.pop(driver, None)
+                self._uses.pop(driver, None)
+            if slot is not None:
+                self._release(slot)
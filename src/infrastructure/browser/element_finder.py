@@ -4,13 +4,14 @@ Clean Architecture - Robust element finding utilities for web automation
 """
 import logging
 import time
-from typing import Optional, List, Dict, Any, Union
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver import Chrome
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
 from .strategy_factory import StrategyFactory
 
@@ -23,20 +24,50 @@ class ElementFinder:
     Uses Strategy pattern for different element location approaches
     """
     
-    def __init__(self, driver: Chrome, strategy_factory: Optional[StrategyFactory] = None):
+    def __init__(
+        self, 
+        driver: Chrome, 
+        strategy_factory: Optional[StrategyFactory] = None,
+        implicit_wait: Optional[int] = None
+    ):
         """
         Initialize element finder.
         
         Args:
             driver: Chrome WebDriver instance
             strategy_factory: Factory for element strategies
+            implicit_wait: Session implicit wait restored after absence probes
+                           (uses config default if None)
         """
+        if implicit_wait is None:
+            from ..config.app_config import AppConfig
+            implicit_wait = AppConfig.get_browser_config()["implicit_wait"]
+        
         self.driver = driver
         self.strategy_factory = strategy_factory or StrategyFactory()
+        self.implicit_wait = implicit_wait
         self.logger = logging.getLogger(__name__)
         
+        # Strategy that last located each element type, tried first next time
+        self._resolved_strategies: Dict[str, Dict[str, Any]] = {}
+        self._last_strategy: Optional[Dict[str, Any]] = None
+        
         self.logger.info("🔍 ElementFinder initialized")
     
+    @contextmanager
+    def without_implicit_wait(self) -> Iterator[None]:
+        """
+        Temporarily disable the session implicit wait.
+        
+        Probes for elements that may legitimately be absent would otherwise
+        block for the full implicit wait on every lookup.
+        """
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+    
     def find_element_with_strategies(
         self, 
         strategies: List[Dict[str, Any]], 
@@ -87,6 +118,7 @@ class ElementFinder:
                     self.logger.debug(f"   ✅ Found element")
                 
                 self.logger.info(f"🎯 Element found using strategy {i}: {description}")
+                self._last_strategy = strategy
                 return element
                 
             except TimeoutException:
@@ -131,12 +163,29 @@ class ElementFinder:
             self.logger.warning(f"⚠️ No strategies available for element type: {element_type}")
             return None
         
-        return self.find_element_with_strategies(
+        # Try the locator that worked last time before walking the full list
+        resolved = self._resolved_strategies.get(element_type)
+        if resolved:
+            element = self.find_element_with_strategies(
+                [resolved],
+                context_message=f"{element_type} (cached locator)",
+                screenshot_on_fail=False
+            )
+            if element:
+                return element
+            strategies = [s for s in strategies if s != resolved]
+        
+        element = self.find_element_with_strategies(
             strategies,
             context_message=f"{element_type} ({context or 'no context'})",
             screenshot_on_fail=screenshot_on_fail,
             raise_on_fail=raise_on_fail
         )
+        
+        if element:
+            self._resolved_strategies[element_type] = self._last_strategy
+        
+        return element
     
     def find_elements_with_strategies(
         self, 
@@ -164,13 +213,14 @@ class ElementFinder:
                 
                 self.logger.debug(f"🔍 Strategy {i}: {description}")
                 
-                # Wait for at least one element to be present
-                WebDriverWait(self.driver, wait_time).until(
-                    EC.presence_of_element_located((selector_type, selector_value))
-                )
-                
-                # Find all matching elements
-                elements = self.driver.find_elements(selector_type, selector_value)
+                with self.without_implicit_wait():
+                    # Wait for at least one element to be present
+                    WebDriverWait(self.driver, wait_time).until(
+                        EC.presence_of_element_located((selector_type, selector_value))
+                    )
+                    
+                    # Find all matching elements
+                    elements = self.driver.find_elements(selector_type, selector_value)
                 
                 if elements:
                     self.logger.info(f"🎯 Found {len(elements)} elements using strategy {i}: {description}")
@@ -204,9 +254,10 @@ class ElementFinder:
         try:
             self.logger.debug(f"⏳ Waiting for element to disappear: {by} = {value}")
             
-            WebDriverWait(self.driver, timeout).until_not(
-                EC.presence_of_element_located((by, value))
-            )
+            with self.without_implicit_wait():
+                WebDriverWait(self.driver, timeout).until_not(
+                    EC.presence_of_element_located((by, value))
+                )
             
             self.logger.debug(f"✅ Element disappeared: {by} = {value}")
             return True
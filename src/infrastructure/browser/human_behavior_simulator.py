@@ -2,11 +2,13 @@
 Human Behavior Simulator - Infrastructure Layer
 Clean Architecture - Advanced human-like browser interactions for anti-detection
 """
+import functools
 import logging
 import random
 import time
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,6 +16,77 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import Chrome
 
 
+# Scrolls the element into view if needed and clicks it in one round-trip.
+# Returns 'hidden' without clicking when the element has no layout box.
+VISIBLE_CLICK_JS = """
+var el = arguments[0];
+var rect = el.getBoundingClientRect();
+if (!(rect.width && rect.height)) {
+    return 'hidden';
+}
+if (rect.top < 0 || rect.bottom > window.innerHeight) {
+    el.scrollIntoView({block: 'center'});
+}
+el.click();
+return 'ok';
+"""
+
+
+# Sets an input's value and notifies listeners; the text is passed as an
+# argument so the script source stays constant and cacheable
+SET_VALUE_JS = "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+
+
+# Polling interval for the element waits below; these helpers are not on the
+# fast form path, so poll gently to keep load off the driver
+ELEMENT_WAIT_POLL_FREQUENCY = 1.0
+DEFAULT_ELEMENT_WAIT_TIMEOUT = 10
+
+# Number of pre-generated jitter values (power of two, indexed with a mask)
+JITTER_TABLE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=64)
+def _presence_of(by: str, value: str) -> Callable:
+    """Cached presence condition for a locator (conditions are stateless)."""
+    return EC.presence_of_element_located((by, value))
+
+
+@functools.lru_cache(maxsize=64)
+def _clickable(by: str, value: str) -> Callable:
+    """Cached clickable condition for a locator (conditions are stateless)."""
+    return EC.element_to_be_clickable((by, value))
+
+
+def page_is_ready(driver: Chrome) -> bool:
+    """WebDriverWait predicate: the current document has finished loading."""
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def _with_js_fallback(fallback: Callable[..., None]) -> Callable:
+    """
+    Retry a human-like interaction through its JavaScript fallback on WebDriver errors.
+    
+    Args:
+        fallback: Called as fallback(simulator, *args, **kwargs) with the decorated
+                  method's arguments; its signature mirrors the method's and it
+                  picks the arguments the JavaScript version needs
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except WebDriverException as e:
+                self.logger.debug("🔄 %s failed, falling back to JavaScript: %s", method.__name__, e)
+                try:
+                    return fallback(self, *args, **kwargs)
+                except WebDriverException as js_error:
+                    self.logger.error("💥 JavaScript fallback for %s error: %s", method.__name__, js_error)
+        return wrapper
+    return decorator
+
+
 class HumanBehaviorSimulator:
     """
     Simulates human-like browser interactions to avoid detection.
@@ -22,32 +95,80 @@ class HumanBehaviorSimulator:
     No domain dependencies - pure infrastructure concern
     """
     
-    def __init__(self, driver: Chrome):
+    def __init__(self, driver: Chrome, human_mode: Optional[bool] = None):
         """
         Initialize human behavior simulator.
         
         Args:
             driver: Chrome WebDriver instance
+            human_mode: Run decorative mouse/scroll behavior and per-character
+                        typing (uses config default if None)
         """
+        if human_mode is None:
+            from ..config.app_config import AppConfig
+            human_mode = AppConfig.get_browser_config()["human_mode"]
+        
         self.driver = driver
-        self.actions = ActionChains(driver)
-        self.wait = WebDriverWait(driver, 10)
+        self.human_mode = human_mode
+        self.wait = self._build_wait(DEFAULT_ELEMENT_WAIT_TIMEOUT)
         self.last_mouse_x = 0
         self.last_mouse_y = 0
         self.logger = logging.getLogger(__name__)
         
+        # Viewport size of the current page, read once per page
+        self._viewport: Optional[List[int]] = None
+        self._last_url: Optional[str] = None
+        
+        # Unit jitter values shared by every randomized pause, scroll and mouse move
+        self._jitter: Tuple[float, ...] = ()
+        self._jitter_index = 0
+        self.reseed()
+        
         self.logger.info("🤖 HumanBehaviorSimulator initialized")
     
-    def random_sleep(self, min_time: float = 1.0, max_time: float = 3.0) -> None:
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """
+        Regenerate the jitter table.
+        
+        Args:
+            seed: Seed for a reproducible sequence of delays (random if None)
+        """
+        rng = random.Random(seed)
+        self._jitter = tuple(rng.random() for _ in range(JITTER_TABLE_SIZE))
+        self._jitter_index = 0
+    
+    def _uniform(self, low: float, high: float) -> float:
+        """Next value between low and high, taken from the jitter table."""
+        value = self._jitter[self._jitter_index & (JITTER_TABLE_SIZE - 1)]
+        self._jitter_index += 1
+        return low + (high - low) * value
+    
+    def random_sleep(
+        self, 
+        min_time: float = 1.0, 
+        max_time: float = 3.0, 
+        until: Optional[Callable[[Chrome], bool]] = None, 
+        timeout: float = 5
+    ) -> None:
         """
         Sleep for a random duration to simulate human behavior.
         
         Args:
             min_time: Minimum sleep duration in seconds
             max_time: Maximum sleep duration in seconds
+            until: Optional WebDriverWait predicate; when given, wait for it
+                   instead and only add a short human-looking pause
+            timeout: Maximum wait for the predicate in seconds
         """
-        sleep_time = random.uniform(min_time, max_time)
-        self.logger.debug(f"😴 Random sleep: {sleep_time:.2f}s")
+        if until is not None:
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(until)
+            except TimeoutException:
+                self.logger.debug("⏰ Sleep predicate not met within %ss", timeout)
+            min_time, max_time = 0.05, 0.15
+        
+        sleep_time = self._uniform(min_time, max_time)
+        self.logger.debug("😴 Random sleep: %.2fs", sleep_time)
         time.sleep(sleep_time)
     
     def scroll_to_element(self, element) -> bool:
@@ -97,39 +218,44 @@ class HumanBehaviorSimulator:
             self.logger.error(f"💥 Visibility check error: {str(e)}")
             return False
     
-    def human_like_click(self, element) -> None:
+    def _js_click(self, element) -> None:
+        """Click element through JavaScript."""
+        self.driver.execute_script("arguments[0].click();", element)
+    
+    def _js_type(self, element, text: str) -> None:
+        """Set input value through JavaScript."""
+        self.driver.execute_script(SET_VALUE_JS, element, text)
+    
+    @_with_js_fallback(lambda self, element, pointer_events=False: self._js_click(element))
+    def human_like_click(self, element, pointer_events: bool = False) -> None:
         """
         Perform human-like click with mouse movement and timing.
         
         Args:
             element: WebElement to click
+            pointer_events: Click with real pointer events (mouse move + click)
+                            instead of the single-call JavaScript click
         """
-        try:
-            # Ensure element is visible
-            if not self.ensure_element_visible(element):
-                self.logger.debug("🖱️ Element not visible, using JavaScript click")
-                self.driver.execute_script("arguments[0].click();", element)
-                self.random_sleep(0.1, 0.3)
+        if not pointer_events:
+            if self.driver.execute_script(VISIBLE_CLICK_JS, element) == 'ok':
+                self.logger.debug("🖱️ JavaScript click performed")
                 return
-            
-            # Human-like ActionChains click
-            self.actions = ActionChains(self.driver)
-            self.actions.move_to_element(element)
-            self.random_sleep(0.1, 0.3)  # Natural pause before click
-            self.actions.click()
-            self.actions.perform()
-            
-            self.logger.debug("🖱️ Human-like click performed")
-            
-        except Exception as e:
-            self.logger.error(f"💥 Click error: {str(e)}")
-            # Fallback to JavaScript click
-            try:
-                self.logger.debug("🔄 Fallback to JavaScript click")
-                self.driver.execute_script("arguments[0].click();", element)
-            except Exception as js_error:
-                self.logger.error(f"💥 JavaScript click error: {str(js_error)}")
+        
+        # Ensure element is visible
+        if not self.ensure_element_visible(element):
+            self.logger.debug("🖱️ Element not visible, using JavaScript click")
+            self._js_click(element)
+            self.random_sleep(until=page_is_ready)
+            return
+        
+        # Human-like move, pause and click, performed in a single actions request
+        ActionChains(self.driver).move_to_element(element).pause(
+            self._uniform(0.1, 0.3)  # Natural pause before click
+        ).click().perform()
+        
+        self.logger.debug("🖱️ Human-like click performed")
     
+    @_with_js_fallback(lambda self, element, text: self._js_type(element, text))
     def human_like_type(self, element, text: str) -> None:
         """
         Type text with human-like timing and behavior.
@@ -138,41 +264,66 @@ class HumanBehaviorSimulator:
             element: Input WebElement
             text: Text to type
         """
-        try:
-            # Ensure element is visible and clickable
-            if not self.ensure_element_visible(element):
-                self.logger.debug("⌨️ Element not visible, using JavaScript")
-                self.driver.execute_script(f"arguments[0].value = '{text}';", element)
-                self.random_sleep(0.1, 0.3)
-                return
-            
-            # Click to focus
-            self.actions = ActionChains(self.driver)
-            self.actions.move_to_element(element)
-            self.random_sleep(0.1, 0.3)
-            self.actions.click()
-            self.actions.perform()
-            
-            # Clear field
+        if not self.human_mode:
+            # One round-trip; invisible elements raise and fall back to JavaScript
             element.clear()
-            
-            # Type character by character with human timing
-            self.logger.debug(f"⌨️ Typing {len(text)} characters with human timing")
-            for char in text:
+            element.send_keys(text)
+            return
+        
+        # Ensure element is visible and clickable
+        if not self.ensure_element_visible(element):
+            self.logger.debug("⌨️ Element not visible, using JavaScript")
+            self._js_type(element, text)
+            self.random_sleep(until=page_is_ready)
+            return
+        
+        # Click to focus
+        ActionChains(self.driver).move_to_element(element).pause(
+            self._uniform(0.1, 0.3)
+        ).click().perform()
+        
+        # Clear field
+        element.clear()
+        
+        # Insert into the focused field through CDP (one round-trip per chunk)
+        remaining = text[self._insert_text(text):]
+        if remaining:
+            # Type what CDP did not insert character by character with human timing
+            self.logger.debug("⌨️ Typing %d characters with human timing", len(remaining))
+            for char in remaining:
                 element.send_keys(char)
-                # Random typing speed between 50-150ms per character
-                self.random_sleep(0.05, 0.15)
-            
-            self.logger.debug("✅ Human-like typing completed")
+                # Random typing speed between 10-40ms per character
+                self.random_sleep(0.01, 0.04)
+        
+        self.logger.debug("✅ Human-like typing completed")
+    
+    def _insert_text(self, text: str) -> int:
+        """
+        Insert text into the focused element via CDP Input.insertText.
+        
+        The text goes in two chunks with a short pause so the input
+        cadence still looks typed rather than pasted.
+        
+        Args:
+            text: Text to insert
             
-        except Exception as e:
-            self.logger.error(f"💥 Typing error: {str(e)}")
-            # Fallback to JavaScript
+        Returns:
+            Number of leading characters inserted (less than len(text) if CDP failed)
+        """
+        inserted = 0
+        middle = len(text) // 2
+        for chunk in (text[:middle], text[middle:]):
+            if not chunk:
+                continue
+            if inserted:
+                time.sleep(0.05)
             try:
-                self.logger.debug("🔄 Fallback to JavaScript value assignment")
-                self.driver.execute_script(f"arguments[0].value = '{text}';", element)
-            except Exception as js_error:
-                self.logger.error(f"💥 JavaScript typing error: {str(js_error)}")
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": chunk})
+            except WebDriverException as e:
+                self.logger.debug("⌨️ Input.insertText failed after %d characters: %s", inserted, e)
+                break
+            inserted += len(chunk)
+        return inserted
     
     def random_scroll(self, scroll_amount: Optional[int] = None) -> None:
         """
@@ -182,11 +333,11 @@ class HumanBehaviorSimulator:
             scroll_amount: Pixels to scroll (random if None)
         """
         if scroll_amount is None:
-            scroll_amount = random.randint(100, 500)
+            scroll_amount = int(self._uniform(100, 500))
         
         try:
             self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            self.logger.debug(f"📜 Random scroll: {scroll_amount}px")
+            self.logger.debug("📜 Random scroll: %dpx", scroll_amount)
             self.random_sleep(0.2, 0.5)
         except Exception as e:
             self.logger.error(f"💥 Random scroll error: {str(e)}")
@@ -196,13 +347,12 @@ class HumanBehaviorSimulator:
         Move mouse randomly to simulate natural user behavior.
         """
         try:
-            viewport_width = self.driver.execute_script("return window.innerWidth;")
-            viewport_height = self.driver.execute_script("return window.innerHeight;")
+            viewport_width, viewport_height = self._get_viewport()
             
             # Calculate safe movement within viewport
             max_move = 200
-            x_offset = random.randint(-max_move, max_move)
-            y_offset = random.randint(-max_move, max_move)
+            x_offset = int(self._uniform(-max_move, max_move))
+            y_offset = int(self._uniform(-max_move, max_move))
             
             # Ensure movement stays within viewport bounds
             new_x = max(0, min(viewport_width - 10, self.last_mouse_x + x_offset))
@@ -214,40 +364,58 @@ class HumanBehaviorSimulator:
             
             # Perform mouse movement
             try:
-                self.actions = ActionChains(self.driver)
-                self.actions.move_by_offset(x_move, y_move)
-                self.actions.perform()
+                ActionChains(self.driver).move_by_offset(x_move, y_move).pause(
+                    self._uniform(0.1, 0.3)
+                ).perform()
                 
                 # Update position tracking
                 self.last_mouse_x = new_x
                 self.last_mouse_y = new_y
-                self.logger.debug(f"🖱️ Random mouse movement: ({x_move}, {y_move})")
+                self.logger.debug("🖱️ Random mouse movement: (%d, %d)", x_move, y_move)
                 
             except Exception:
                 # Reset mouse to center if movement fails
                 self.logger.debug("🔄 Mouse movement failed, resetting to center")
                 body = self.driver.find_element(By.TAG_NAME, "body")
-                self.actions = ActionChains(self.driver)
-                self.actions.move_to_element(body)
-                self.actions.perform()
+                ActionChains(self.driver).move_to_element(body).perform()
                 self.last_mouse_x = viewport_width // 2
                 self.last_mouse_y = viewport_height // 2
             
-            self.random_sleep(0.1, 0.3)
-            
         except Exception as e:
             self.logger.error(f"💥 Mouse movement error: {str(e)}")
             # Reset tracking on error
             self.last_mouse_x = 0
             self.last_mouse_y = 0
     
+    def _get_viewport(self) -> List[int]:
+        """Get [width, height] of the viewport, cached until the page changes."""
+        if self._viewport is None:
+            self._viewport = self.driver.execute_script("return [window.innerWidth, window.innerHeight];")
+        return self._viewport
+    
+    def _invalidate_viewport_on_navigation(self) -> None:
+        """Drop the cached viewport when the driver is on a new URL."""
+        current_url = self.driver.current_url
+        if current_url != self._last_url:
+            self._last_url = current_url
+            self._viewport = None
+    
     def simulate_human_behavior(self) -> None:
         """
         Perform a combination of human-like behaviors.
+        
+        No-op unless human mode is enabled; nobody watches the server-side runs.
         """
+        if not self.human_mode:
+            return
+        
         try:
             self.logger.debug("🎭 Simulating human behavior sequence")
             
+            # Only the mouse movement below reads the viewport, so the URL
+            # check is paid here rather than on every element wait
+            self._invalidate_viewport_on_navigation()
+            
             # Random mouse movement
             self.move_mouse_randomly()
             
@@ -262,7 +430,22 @@ class HumanBehaviorSimulator:
         except Exception as e:
             self.logger.error(f"💥 Human behavior simulation error: {str(e)}")
     
-    def wait_for_element(self, by: By, value: str, timeout: int = 10):
+    def _build_wait(self, timeout: float) -> WebDriverWait:
+        """Create an element wait with the shared polling settings."""
+        return WebDriverWait(
+            self.driver, 
+            timeout, 
+            poll_frequency=ELEMENT_WAIT_POLL_FREQUENCY,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
+    
+    def _get_wait(self, timeout: float) -> WebDriverWait:
+        """Reuse the prebuilt wait for the default timeout."""
+        if timeout == DEFAULT_ELEMENT_WAIT_TIMEOUT:
+            return self.wait
+        return self._build_wait(timeout)
+    
+    def wait_for_element(self, by: By, value: str, timeout: int = DEFAULT_ELEMENT_WAIT_TIMEOUT):
         """
         Wait for element with human behavior simulation.
         
@@ -275,24 +458,22 @@ class HumanBehaviorSimulator:
             WebElement when found
         """
         try:
-            self.logger.debug(f"⏳ Waiting for element: {by} = {value} (timeout: {timeout}s)")
+            self.logger.debug("⏳ Waiting for element: %s = %s (timeout: %ss)", by, value, timeout)
             
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
+            element = self._get_wait(timeout).until(_presence_of(by, value))
             
             # Scroll to element and simulate behavior
             self.scroll_to_element(element)
             self.simulate_human_behavior()
             
-            self.logger.debug(f"✅ Element found with human behavior: {by} = {value}")
+            self.logger.debug("✅ Element found with human behavior: %s = %s", by, value)
             return element
             
         except Exception as e:
             self.logger.error(f"💥 Element wait error: {str(e)}")
             raise
     
-    def wait_for_clickable(self, by: By, value: str, timeout: int = 10):
+    def wait_for_clickable(self, by: By, value: str, timeout: int = DEFAULT_ELEMENT_WAIT_TIMEOUT):
         """
         Wait for clickable element with human behavior.
         
@@ -305,17 +486,15 @@ class HumanBehaviorSimulator:
             Clickable WebElement
         """
         try:
-            self.logger.debug(f"🖱️ Waiting for clickable: {by} = {value} (timeout: {timeout}s)")
+            self.logger.debug("🖱️ Waiting for clickable: %s = %s (timeout: %ss)", by, value, timeout)
             
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
+            element = self._get_wait(timeout).until(_clickable(by, value))
             
             # Scroll to element and simulate behavior
             self.scroll_to_element(element)
             self.simulate_human_behavior()
             
-            self.logger.debug(f"✅ Clickable element found: {by} = {value}")
+            self.logger.debug("✅ Clickable element found: %s = %s", by, value)
             return element
             
         except Exception as e:
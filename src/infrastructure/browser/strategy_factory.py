@@ -3,7 +3,7 @@ Strategy Factory - Infrastructure Layer
 Clean Architecture - Element finding strategies for robust web automation
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from selenium.webdriver.common.by import By
 
@@ -61,6 +61,9 @@ class StrategyFactory:
     def __init__(self):
         """Initialize strategy factory."""
         self.logger = logging.getLogger(__name__)
+        
+        # Strategies are static per (element_type, context); build them once
+        self._strategy_cache: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {}
     
     def get_strategies_for(self, element_type: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -73,6 +76,10 @@ class StrategyFactory:
         Returns:
             List of strategy dictionaries ordered by reliability
         """
+        cached = self._strategy_cache.get((element_type, context))
+        if cached is not None:
+            return list(cached)
+        
         self.logger.debug(f"🎯 Creating strategies for '{element_type}' (context: {context})")
         
         # Strategy dispatch based on element type
@@ -95,8 +102,10 @@ class StrategyFactory:
         strategies = strategy_method(context)
         strategy_dicts = [s.to_dict() for s in strategies]
         
+        self._strategy_cache[(element_type, context)] = strategy_dicts
+        
         self.logger.debug(f"✅ Created {len(strategy_dicts)} strategies for {element_type}")
-        return strategy_dicts
+        return list(strategy_dicts)
     
     def _get_barcode_input_strategies(self, context: Optional[str] = None) -> List[ElementStrategy]:
         """Get strategies for barcode input field."""
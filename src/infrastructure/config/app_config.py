@@ -2,74 +2,290 @@
 Simple Application Configuration
 Environment-based configuration management
 """
+import functools
+import ipaddress
 import os
-from typing import Dict, Any, List
+import platform
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Optional
+
+# Values baked from .env at deploy time by scripts/compile_env.py (optional)
+try:
+    from .env_compiled import ENV as _COMPILED_ENV
+except ImportError:
+    _COMPILED_ENV = None
+
+
+def load_compiled_env() -> bool:
+    """
+    Apply the deploy-time compiled .env values without overriding set variables.
+    
+    Returns:
+        True if a compiled module was found (no .env parsing is needed)
+    """
+    if _COMPILED_ENV is None:
+        return False
+    for key, value in _COMPILED_ENV.items():
+        os.environ.setdefault(key, value)
+    return True
+
+
+# Snapshot of os.environ taken on first read (after main.load_environment has
+# filled in its defaults); every getter reads from this plain dict
+_ENV: Optional[Dict[str, str]] = None
+
+
+def _get(key: str, default: Any = None, cast: Callable[[str], Any] = str) -> Any:
+    """
+    Read one environment variable from the snapshot.
+    
+    Args:
+        key: Variable name
+        default: Value returned when the variable is not set (not cast)
+        cast: Conversion applied to a set value
+        
+    Returns:
+        The cast value, or default
+    """
+    global _ENV
+    if _ENV is None:
+        _ENV = os.environ.copy()
+    value = _ENV.get(key)
+    return cast(value) if value is not None else default
+
+
+@functools.lru_cache(maxsize=None)
+def env_int(key: str, default: int = 0) -> int:
+    """Integer environment variable, parsed once per key/default pair."""
+    value = _get(key)
+    return int(value) if value else default
+
+
+@functools.lru_cache(maxsize=None)
+def env_float(key: str, default: float = 0.0) -> float:
+    """Float environment variable, parsed once per key/default pair."""
+    value = _get(key)
+    return float(value) if value else default
+
+
+@functools.lru_cache(maxsize=None)
+def env_bool(key: str, default: bool = False) -> bool:
+    """Boolean environment variable ("true" in any case), parsed once per key/default pair."""
+    value = _get(key)
+    return value.lower() == "true" if value is not None else default
+
+
+def _window_size(value: str) -> str:
+    """
+    Parse a "width,height" window size once, at config time.
+    
+    Invalid sizes fail when the section is built instead of at browser launch,
+    and spacing variants ("1920, 1080") are normalized for Chrome's --window-size.
+    """
+    width, height = map(int, value.split(","))
+    return f"{width},{height}"
+
+
+@functools.lru_cache(maxsize=None)
+def _cwd() -> str:
+    """Working directory the default data directories are resolved against (read once)."""
+    return os.getcwd()
+
+
+# Variables the service cannot run without (checked by AppConfig.get_missing_required)
+REQUIRED_ENV_VARS = ("BACKEND_API_BASE_URL", "BACKEND_API_EMAIL", "BACKEND_API_PASSWORD")
+
+
+# Config sections built so far, keyed by getter name. Sections are read-only
+# views, so every caller can share the same object without copying it
+_SECTIONS: Dict[str, Mapping[str, Any]] = {}
+
+
+def _cached_section(build: Callable[[Any], Dict[str, Any]]) -> Callable[[Any], Mapping[str, Any]]:
+    """Build a config section on first request and serve the same read-only view afterwards."""
+    @functools.wraps(build)
+    def getter(cls) -> Mapping[str, Any]:
+        section = _SECTIONS.get(build.__name__)
+        if section is None:
+            section = _SECTIONS[build.__name__] = MappingProxyType(build(cls))
+        return section
+    return getter
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_platform() -> Mapping[str, Any]:
+    """Detect the host platform once per process."""
+    system = platform.system()
+    return MappingProxyType({
+        "system": system,
+        "machine": platform.machine(),
+        "is_macos": system == "Darwin",
+        "is_linux": system == "Linux",
+        "is_windows": system == "Windows"
+    })
 
 
 class AppConfig:
-    """Simple application configuration from environment variables."""
+    """
+    Simple application configuration from environment variables.
+    
+    Sections are computed on first access and cached; call reload() after
+    changing the environment.
+    """
+    
+    @classmethod
+    def reload(cls) -> None:
+        """Drop the environment snapshot and cached sections."""
+        global _ENV
+        _ENV = None
+        _SECTIONS.clear()
+        for typed_getter in (env_int, env_float, env_bool):
+            typed_getter.cache_clear()
+    
+    @classmethod
+    def preload(cls) -> None:
+        """
+        Build every cached section now.
+        
+        Called once at startup so invalid values fail immediately; a process
+        that forks workers afterwards shares the built sections copy-on-write.
+        """
+        for getter in (
+            cls.get_flask_config, cls.get_database_config, cls.get_backend_config,
+            cls.get_verification_config, cls.get_browser_config, cls.get_download_config,
+            cls.get_processing_config, cls.get_platform_config, cls.get_security_config
+        ):
+            getter()
     
     @classmethod
-    def get_flask_config(cls) -> Dict[str, Any]:
+    def get_missing_required(cls) -> List[str]:
+        """
+        List required environment variables that are unset or empty.
+        
+        Returns:
+            Names from REQUIRED_ENV_VARS without a value, in declaration order
+        """
+        return [key for key in REQUIRED_ENV_VARS if not _get(key)]
+    
+    @classmethod
+    @_cached_section
+    def get_flask_config(cls) -> Mapping[str, Any]:
         """Get Flask configuration."""
         return {
-            "host": os.getenv("FLASK_HOST", "0.0.0.0"),
-            "port": int(os.getenv("FLASK_PORT", "5002")),
-            "debug": os.getenv("FLASK_DEBUG", "false").lower() == "true"
+            "host": _get("FLASK_HOST", "0.0.0.0"),
+            "port": env_int("FLASK_PORT", 5002),
+            "debug": env_bool("FLASK_DEBUG", False)
         }
     
     @classmethod
-    def get_database_config(cls) -> Dict[str, Any]:
+    @_cached_section
+    def get_database_config(cls) -> Mapping[str, Any]:
         """Get database configuration."""
         return {
-            "path": os.getenv("DATABASE_PATH", "queue_clean.db")
+            "path": _get("DATABASE_PATH", "queue_clean.db")
         }
     
     @classmethod
-    def get_backend_config(cls) -> Dict[str, Any]:
+    @_cached_section
+    def get_backend_config(cls) -> Mapping[str, Any]:
         """Get backend API configuration."""
         return {
-            "base_url": os.getenv("BACKEND_API_BASE_URL", ""),
-            "email": os.getenv("BACKEND_API_EMAIL", ""),
-            "password": os.getenv("BACKEND_API_PASSWORD", ""),
-            "timeout": int(os.getenv("BACKEND_API_TIMEOUT", "30"))
+            "base_url": _get("BACKEND_API_BASE_URL", ""),
+            "email": _get("BACKEND_API_EMAIL", ""),
+            "password": _get("BACKEND_API_PASSWORD", ""),
+            "timeout": env_int("BACKEND_API_TIMEOUT", 30),
+            "pool_size": env_int("BACKEND_API_POOL_SIZE", 64),
+            "notify_workers": env_int("BACKEND_API_NOTIFY_WORKERS", 8)
         }
     
     @classmethod
-    def get_verification_config(cls) -> Dict[str, Any]:
+    @_cached_section
+    def get_verification_config(cls) -> Mapping[str, Any]:
         """Get document verification configuration."""
         return {
-            "enabled": os.getenv("EDEVLET_VERIFICATION_ENABLED", "false").lower() == "true",
-            "url": os.getenv("EDEVLET_VERIFICATION_URL", "https://www.turkiye.gov.tr/belge-dogrulama"),
-            "timeout": int(os.getenv("VERIFICATION_TIMEOUT", "30")),
-            "headless": os.getenv("BROWSER_HEADLESS", "true").lower() == "true"
+            "enabled": env_bool("EDEVLET_VERIFICATION_ENABLED", False),
+            "url": _get("EDEVLET_VERIFICATION_URL", "https://www.turkiye.gov.tr/belge-dogrulama"),
+            "timeout": env_int("VERIFICATION_TIMEOUT", 30),
+            "headless": env_bool("BROWSER_HEADLESS", True)
         }
     
     @classmethod
-    def get_browser_config(cls) -> Dict[str, Any]:
+    @_cached_section
+    def get_browser_config(cls) -> Mapping[str, Any]:
         """Get browser configuration."""
         return {
-            "headless": os.getenv("BROWSER_HEADLESS", "true").lower() == "true",
-            "timeout": int(os.getenv("BROWSER_TIMEOUT", "30"))
+            "headless": env_bool("BROWSER_HEADLESS", True),
+            "timeout": env_int("BROWSER_TIMEOUT", 30),
+            "implicit_wait": env_int("BROWSER_IMPLICIT_WAIT", 2),
+            "pool_size": env_int("BROWSER_POOL_SIZE", 1),
+            "max_uses": env_int("BROWSER_MAX_USES", 50),
+            "human_mode": env_bool("BROWSER_HUMAN_MODE", False),
+            "window_size": _get("BROWSER_WINDOW_SIZE", "1920,1080", _window_size),
+            "stealth_mode": env_bool("BROWSER_STEALTH_MODE", True),
+            "use_undetected": env_bool("BROWSER_USE_UNDETECTED", True),
+            "use_pipe": env_bool("BROWSER_USE_PIPE", False),
+            "extra_flags": tuple(_get("BROWSER_EXTRA_FLAGS", "").split()),
+            "cache_dir": _get("BROWSER_CACHE_DIR", os.path.join(_cwd(), "browser_cache"))
+        }
+    
+    @classmethod
+    @_cached_section
+    def get_download_config(cls) -> Mapping[str, Any]:
+        """Get download directory configuration."""
+        storage_dir = _get("DOWNLOADS_DIR", os.path.join(_cwd(), "downloads"))
+        
+        # Browser downloads land on tmpfs when available and are moved to storage_dir afterwards
+        default_download_dir = "/dev/shm/edevlet-downloads" if os.path.isdir("/dev/shm") else storage_dir
+        
+        return {
+            "download_dir": _get("EDEVLET_DOWNLOAD_DIR", default_download_dir),
+            "storage_dir": storage_dir
         }
     
     @classmethod
-    def get_processing_config(cls) -> Dict[str, Any]:
+    @_cached_section
+    def get_processing_config(cls) -> Mapping[str, Any]:
         """Get processing configuration."""
         return {
-            "batch_size": int(os.getenv("BATCH_SIZE", "1")),
-            "processing_interval_hours": int(os.getenv("PROCESSING_INTERVAL_HOURS", "2")),
-            "max_retry_count": int(os.getenv("MAX_RETRY_COUNT", "3"))
+            "batch_size": env_int("BATCH_SIZE", 1),
+            "processing_interval_hours": env_int("PROCESSING_INTERVAL_HOURS", 2),
+            "max_retry_count": env_int("MAX_RETRY_COUNT", 3),
+            "verify_workers": env_int("VERIFY_WORKERS", 8),
+            "circuit_breaker_threshold": env_int("CIRCUIT_BREAKER_THRESHOLD", 5),
+            "circuit_breaker_reset_seconds": env_int("CIRCUIT_BREAKER_RESET_SECONDS", 30),
+            "verification_cache_size": env_int("VERIFICATION_CACHE_SIZE", 10000),
+            "verification_cache_ttl": env_int("VERIFICATION_CACHE_TTL", 3600)
         }
     
+    @classmethod
+    def get_platform_config(cls) -> Mapping[str, Any]:
+        """Get host platform information (detected once, then cached)."""
+        return _detect_platform()
+    
     @classmethod
     def is_development_mode(cls) -> bool:
         """Check if running in development mode."""
-        return os.getenv("ENVIRONMENT", "development") == "development"
+        return _get("ENVIRONMENT", "development") == "development"
+    
+    @classmethod
+    def is_required_validation_enabled(cls) -> bool:
+        """Check if startup should fail when required variables are missing."""
+        return env_bool("VALIDATE_REQUIRED_CONFIG", True)
     
     @classmethod
-    def get_security_config(cls) -> Dict[str, Any]:
+    @_cached_section
+    def get_security_config(cls) -> Mapping[str, Any]:
         """Get security configuration."""
+        # ALLOWED_IPS is parsed once here, request checks only compare addresses.
+        # Single addresses go into a set (one lookup for the common case),
+        # only CIDR ranges need a network walk
+        entries = [entry.strip() for entry in _get("ALLOWED_IPS", "").split(",") if entry.strip()]
         return {
-            "cors_origins": ["*"]  # Simple CORS for development
+            "cors_origins": ("*",),  # Simple CORS for development
+            "allowed_ips": frozenset(
+                str(ipaddress.ip_address(entry)) for entry in entries if "/" not in entry
+            ),
+            "allowed_networks": tuple(
+                ipaddress.ip_network(entry, strict=False) for entry in entries if "/" in entry
+            )
         } 
\ No newline at end of file
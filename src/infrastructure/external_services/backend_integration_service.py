@@ -2,14 +2,118 @@
 Backend Integration Service - Infrastructure Layer
 Clean Architecture - Backend API integration implementation
 """
+import atexit
+import base64
 import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from application.use_cases.process_document_use_case import IBackendNotifier, ValidationResult
 from domain.entities.event import Event
+from domain.value_objects.event_type import EventTypeEnum
+
+# Connection pool per host: enough idle keep-alive connections for every
+# notifier thread, so none is discarded and renegotiated under load
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 64
+
+# Bulk notifications are posted in parallel over the pooled connections
+DEFAULT_NOTIFY_WORKERS = 8
+
+# Transient failures (connection errors, 5xx) are retried by urllib3 with
+# exponential backoff and Retry-After support; the final response is still
+# returned (raise_on_status=False) so callers keep their status-code handling
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "PUT", "POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# TCP keepalive on pooled sockets, so NATs and load balancers don't silently
+# drop idle connections between verification runs. The idle/interval/count
+# options are not available on every platform and are only set where they are
+KEEPALIVE_IDLE_SECONDS = 60
+KEEPALIVE_INTERVAL_SECONDS = 30
+KEEPALIVE_PROBES = 3
+_TCP_KEEPALIVE_TUNING = (
+    ("TCP_KEEPIDLE", KEEPALIVE_IDLE_SECONDS),
+    ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL_SECONDS),
+    ("TCP_KEEPCNT", KEEPALIVE_PROBES)
+)
+KEEPALIVE_SOCKET_OPTIONS = (
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    *(
+        (socket.IPPROTO_TCP, getattr(socket, name), value)
+        for name, value in _TCP_KEEPALIVE_TUNING
+        if hasattr(socket, name)
+    )
+)
+
+# Tokens are renewed this many seconds before their JWT "exp", so a request
+# never leaves with a token that expires in flight
+TOKEN_EXPIRY_SKEW = 30
+
+# Content type of the pre-encoded request bodies
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+# Clients shared by get_shared(), keyed by their settings; closed at interpreter exit
+_shared_clients: Dict[Tuple[Any, ...], "BackendIntegrationService"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Close the connection pools of the shared clients."""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        client.close()
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keepalive probes."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", list(KEEPALIVE_SOCKET_OPTIONS))
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a request body as compact UTF-8 JSON."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the "exp" claim of a JWT without verifying it.
+    
+    Args:
+        token: Bearer token returned by the backend
+        
+    Returns:
+        Expiry as a Unix timestamp, or None if the token carries none
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
 
 
 class BackendIntegrationService(IBackendNotifier):
@@ -20,7 +124,22 @@ class BackendIntegrationService(IBackendNotifier):
     Single Responsibility: Only handles backend API communication
     """
     
-    def __init__(self, base_url: str, email: str, password: str, timeout: int = 30):
+    __slots__ = (
+        "base_url", "email", "password", "timeout", "logger", "session", "notify_workers",
+        "_url_login", "_url_education", "_url_security", "_url_user", "_url_health",
+        "_update_endpoints", "_update_templates", "_send_settings",
+        "_auth_token", "_auth_token_exp", "_auth_lock"
+    )
+    
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        password: str,
+        timeout: int = 30,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        notify_workers: int = DEFAULT_NOTIFY_WORKERS
+    ):
         """
         Initialize backend integration service.
         
@@ -29,14 +148,92 @@ class BackendIntegrationService(IBackendNotifier):
             email: Authentication email
             password: Authentication password
             timeout: Request timeout in seconds
+            pool_maxsize: Keep-alive connections kept per host
+            notify_workers: Updates posted in parallel by bulk notifications
         """
         self.base_url = base_url.rstrip('/')
+        
+        # Endpoint URLs are built once, not formatted per request
+        self._url_login = f"{self.base_url}/api/Auth/login"
+        self._url_education = f"{self.base_url}/api/UserEducation/UpdateDocumentVerification"
+        self._url_security = f"{self.base_url}/api/UserSecurity/UpdateDocumentVerification"
+        self._url_user = f"{self.base_url}/api/User/"
+        self._url_health = f"{self.base_url}/api/health"
+        
+        # Update endpoint per event type; types without one (CV) are not reported
+        self._update_endpoints: Dict[str, str] = {
+            EventTypeEnum.USER_EDUCATION_CREATED: self._url_education,
+            EventTypeEnum.USER_SECURITY_CREATED: self._url_security
+        }
         self.email = email
         self.password = password
         self.timeout = timeout
         self.logger = logging.getLogger("backend")
         self._auth_token: Optional[str] = None
+        self._auth_token_exp: Optional[float] = None
+        # Serializes logins, so threads that find the token missing or rejected log in once
+        self._auth_lock = threading.Lock()
+        self.notify_workers = max(1, min(notify_workers, pool_maxsize))
+        
+        # Every call goes through one session so TCP/TLS connections to the
+        # backend are kept alive and reused instead of renegotiated per request
         self.session = requests.Session()
+        adapter = KeepAliveHTTPAdapter(
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=RETRY_POLICY
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Update requests are copied from a prepared template instead of going
+        # through Session.request, which merges headers, cookies and URL parsing
+        # on every call. The proxy/verify settings it would read from the
+        # environment are resolved here once, for the backend host
+        self._update_templates: Dict[str, requests.PreparedRequest] = {
+            url: self.session.prepare_request(requests.Request("POST", url, headers=JSON_HEADERS))
+            for url in self._update_endpoints.values()
+        }
+        self._send_settings = self.session.merge_environment_settings(
+            self.base_url, {}, None, None, None
+        )
+    
+    @classmethod
+    def get_shared(
+        cls,
+        base_url: str,
+        email: str,
+        password: str,
+        timeout: int = 30,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        notify_workers: int = DEFAULT_NOTIFY_WORKERS
+    ) -> "BackendIntegrationService":
+        """
+        Get the process-wide client for these settings, creating it on first use.
+        
+        Callers share its session, connection pool and token instead of each
+        building their own. The shared client is closed at interpreter exit,
+        so callers must not close it themselves.
+        
+        Args:
+            base_url: Backend API base URL
+            email: Authentication email
+            password: Authentication password
+            timeout: Request timeout in seconds
+            pool_maxsize: Keep-alive connections kept per host
+            notify_workers: Updates posted in parallel by bulk notifications
+            
+        Returns:
+            Shared BackendIntegrationService instance
+        """
+        key = (base_url.rstrip('/'), email, password, timeout, pool_maxsize, notify_workers)
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = cls(base_url, email, password, timeout, pool_maxsize, notify_workers)
+                _shared_clients[key] = client
+        return client
     
     def notify_verification_result(self, event: Event, result: ValidationResult) -> bool:
         """
@@ -48,37 +245,80 @@ class BackendIntegrationService(IBackendNotifier):
             
         Returns:
             True if notification was successful
-        """
-        try:
-            self.logger.info(f"📡 Notifying backend about event: {event.id}")
-            self.logger.info(f"📊 Validation result: {result.success}")
-            
-            # Authenticate if needed
-            if not self._authenticate():
-                return False
-            
-            # Determine document type and endpoint
-            endpoint, document_id = self._get_update_endpoint_and_id(event)
-            if not endpoint:
-                self.logger.error(f"❌ Cannot determine update endpoint for event type: {event.event_type}")
-                return False
             
-            # Prepare update data
-            update_data = self._prepare_update_data(event, result, document_id)
-            
-            # Send update request
-            success = self._send_update_request(endpoint, update_data)
-            
-            if success:
-                self.logger.info(f"✅ Backend notification successful for event: {event.id}")
-            else:
-                self.logger.error(f"❌ Backend notification failed for event: {event.id}")
-            
-            return success
+        Network errors are reported as False (transient ones are retried by
+        the session adapter first); anything else is a bug and propagates.
+        """
+        self.logger.info("📡 Notifying backend about event: %s", event.id)
+        self.logger.info("📊 Validation result: %s", result.success)
+        
+        # Authenticate if needed
+        if not self._authenticate():
+            return False
+        
+        # Determine document type and endpoint
+        endpoint, document_id = self._get_update_endpoint_and_id(event)
+        if not endpoint:
+            self.logger.error(f"❌ Cannot determine update endpoint for event type: {event.event_type}")
+            return False
+        
+        # Prepare update data
+        update_data = self._prepare_update_data(event, result, document_id)
+        
+        # Send update request
+        success = self._send_update_request(endpoint, update_data)
+        
+        if success:
+            self.logger.info("✅ Backend notification successful for event: %s", event.id)
+        else:
+            self.logger.error(f"❌ Backend notification failed for event: {event.id}")
+        
+        return success
+    
+    def notify_verification_results_bulk(self, pairs: List[Tuple[Event, ValidationResult]]) -> List[bool]:
+        """
+        Notify backend about several verification results.
+        
+        The backend has no bulk endpoint, so updates are posted individually,
+        in parallel over the pooled connections; authentication and the
+        verification timestamp are shared by the whole batch.
+        
+        Args:
+            pairs: (event, validation result) pairs
             
-        except Exception as e:
-            self.logger.error(f"💥 Backend notification error: {str(e)}")
+        Returns:
+            Success flag for each pair, in order
+        """
+        if not pairs:
+            return []
+        
+        self.logger.info("📡 Notifying backend about %s events", len(pairs))
+        
+        if not self._authenticate():
+            return [False] * len(pairs)
+        
+        verified_at = datetime.now().isoformat()
+        
+        if len(pairs) == 1 or self.notify_workers == 1:
+            return [self._notify_one(event, result, verified_at) for event, result in pairs]
+        
+        # requests.Session and its urllib3 pool are thread-safe; map() keeps the input order
+        max_workers = min(self.notify_workers, len(pairs))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="backend-notify") as executor:
+            return list(executor.map(
+                lambda pair: self._notify_one(pair[0], pair[1], verified_at), pairs
+            ))
+    
+    def _notify_one(self, event: Event, result: ValidationResult, verified_at: str) -> bool:
+        """Post one result of a bulk notification (network errors are logged, not raised)."""
+        endpoint, document_id = self._get_update_endpoint_and_id(event)
+        if not endpoint:
+            self.logger.error(f"❌ Cannot determine update endpoint for event type: {event.event_type}")
             return False
+        
+        update_data = self._prepare_update_data(event, result, document_id)
+        update_data["verifiedAt"] = verified_at
+        return self._send_update_request(endpoint, update_data)
     
     def update_education_document(
         self, 
@@ -101,26 +341,11 @@ class BackendIntegrationService(IBackendNotifier):
         Returns:
             True if update was successful
         """
-        try:
-            if not self._authenticate():
-                return False
-            
-            endpoint = f"{self.base_url}/api/UserEducation/UpdateDocumentVerification"
-            
-            data = {
-                "userId": user_id,
-                "educationId": education_id,
-                "documentNumber": document_number,
-                "documentVerified": is_verified,
-                "verificationDescription": description,
-                "verifiedAt": datetime.now().isoformat()
-            }
-            
-            return self._send_update_request(endpoint, data)
-            
-        except Exception as e:
-            self.logger.error(f"💥 Education document update error: {str(e)}")
-            return False
+        return self._update_document(
+            self._url_education,
+            {"userId": user_id, "educationId": education_id},
+            document_number, is_verified, description
+        )
     
     def update_security_document(
         self, 
@@ -143,54 +368,85 @@ class BackendIntegrationService(IBackendNotifier):
         Returns:
             True if update was successful
         """
-        try:
-            if not self._authenticate():
-                return False
-            
-            endpoint = f"{self.base_url}/api/UserSecurity/UpdateDocumentVerification"
-            
-            data = {
-                "userId": user_id,
-                "securityId": security_id,
-                "documentNumber": document_number,
-                "documentVerified": is_verified,
-                "verificationDescription": description,
-                "verifiedAt": datetime.now().isoformat()
-            }
-            
-            return self._send_update_request(endpoint, data)
+        return self._update_document(
+            self._url_security,
+            {"userId": user_id, "securityId": security_id},
+            document_number, is_verified, description
+        )
+    
+    def _update_document(
+        self,
+        endpoint: str,
+        ids: Dict[str, Any],
+        document_number: str,
+        is_verified: bool,
+        description: str
+    ) -> bool:
+        """
+        Post a document verification update (shared by the education and security updates).
+        
+        Args:
+            endpoint: Update endpoint URL
+            ids: Identifier fields of the document ("userId" plus the document id field)
+            document_number: Document barcode number
+            is_verified: Verification result
+            description: Description of verification
             
-        except Exception as e:
-            self.logger.error(f"💥 Security document update error: {str(e)}")
+        Returns:
+            True if update was successful
+        """
+        if not self._authenticate():
             return False
+        
+        data = {
+            **ids,
+            "documentNumber": document_number,
+            "documentVerified": is_verified,
+            "verificationDescription": description,
+            "verifiedAt": datetime.now().isoformat()
+        }
+        return self._send_update_request(endpoint, data)
+    
+    def _has_valid_token(self) -> bool:
+        """Check for a token that is not about to expire."""
+        if not self._auth_token:
+            return False
+        # Tokens without an exp claim are used until the backend answers 401
+        expires_at = self._auth_token_exp
+        return expires_at is None or time.time() < expires_at - TOKEN_EXPIRY_SKEW
     
     def _authenticate(self) -> bool:
-        """Authenticate with backend API."""
-        try:
-            if self._auth_token:
-                # Token exists, assume it's valid for now
-                # TODO: Implement token validation/refresh
+        """Authenticate with backend API (one login even when several threads need it)."""
+        if self._has_valid_token():
+            return True
+        
+        with self._auth_lock:
+            # Another thread may have logged in while this one waited
+            if self._has_valid_token():
                 return True
-            
-            auth_endpoint = f"{self.base_url}/api/Auth/login"
-            
+            return self._login()
+    
+    def _login(self) -> bool:
+        """Log in and store the new token (caller holds _auth_lock)."""
+        try:
             auth_data = {
                 "email": self.email,
                 "password": self.password
             }
             
-            self.logger.info(f"🔐 Authenticating with backend...")
+            self.logger.info("🔐 Authenticating with backend...")
             
-            response = requests.post(
-                auth_endpoint,
+            # json= sets Content-Type; the login call must not carry a stale token
+            response = self.session.post(
+                self._url_login,
                 json=auth_data,
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
+                headers={"Authorization": None}
             )
             
             if response.status_code == 200:
                 auth_result = response.json()
-                self._auth_token = auth_result.get('token')
+                self._set_auth_token(auth_result.get('token'))
                 if self._auth_token:
                     self.logger.info("✅ Backend authentication successful")
                     return True
@@ -202,33 +458,34 @@ class BackendIntegrationService(IBackendNotifier):
                 return False
                 
         except requests.RequestException as e:
+            # Also covers an unparsable response body (requests' JSONDecodeError)
             self.logger.error(f"💥 Authentication request error: {str(e)}")
             return False
-        except Exception as e:
-            self.logger.error(f"💥 Authentication error: {str(e)}")
-            return False
+    
+    def _set_auth_token(self, token: Optional[str]) -> None:
+        """Store the bearer token on the session, so requests don't build auth headers each time."""
+        # Parsed once per login, so validity checks are a float comparison
+        self._auth_token_exp = _jwt_expiry(token) if token else None
+        self._auth_token = token
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
     
     def _get_update_endpoint_and_id(self, event: Event) -> tuple[Optional[str], Optional[str]]:
         """Get appropriate update endpoint and document ID for event."""
-        event_type_str = str(event.event_type)
-        
-        if "Education" in event_type_str:
-            endpoint = f"{self.base_url}/api/UserEducation/UpdateDocumentVerification"
-            document_id = event.event_data.get('id', event.user_id)
-            return endpoint, document_id
-        elif "Security" in event_type_str:
-            endpoint = f"{self.base_url}/api/UserSecurity/UpdateDocumentVerification"
-            document_id = event.event_data.get('id', event.user_id)
-            return endpoint, document_id
-        else:
+        # EventTypeEnum members are str, so the raw value finds its endpoint
+        endpoint = self._update_endpoints.get(event.event_type.value)
+        if endpoint is None:
             return None, None
+        return endpoint, event.event_data.get('id', event.user_id)
     
     def _prepare_update_data(self, event: Event, result: ValidationResult, document_id: str) -> Dict[str, Any]:
         """Prepare update data for backend request."""
         return {
             "userId": event.user_id,
             "documentId": document_id,
-            "documentNumber": str(event.document_number) if event.document_number else "",
+            "documentNumber": event.document_number.value if event.document_number else "",
             "documentVerified": result.success,
             "verificationDescription": result.message or ("Verification successful" if result.success else "Verification failed"),
             "verifiedAt": datetime.now().isoformat(),
@@ -236,26 +493,72 @@ class BackendIntegrationService(IBackendNotifier):
             "eventId": event.id
         }
     
+    def _post_authorized(self, endpoint: str, data: Dict[str, Any]) -> requests.Response:
+        """
+        POST JSON as the authenticated user, re-authenticating once if the token was rejected.
+        
+        Args:
+            endpoint: Request URL
+            data: JSON body
+            
+        Returns:
+            Backend response (the 401 itself if re-authentication failed)
+        """
+        # Serialized once (also for the retry below), compact and UTF-8 rather
+        # than requests' default spaced, ASCII-escaped encoding
+        body = _encode_json(data)
+        token = self._auth_token
+        response = self._send_json(endpoint, body, token)
+        
+        # Expired token: log in again and retry once
+        if response.status_code == 401:
+            self.logger.warning("🔐 Backend token rejected, re-authenticating")
+            with self._auth_lock:
+                # Only drop the token this request used, not one a concurrent login just stored
+                if self._auth_token == token:
+                    self._set_auth_token(None)
+            if self._authenticate():
+                response = self._send_json(endpoint, body, self._auth_token)
+        
+        return response
+    
+    def _send_json(self, endpoint: str, body: bytes, token: Optional[str]) -> requests.Response:
+        """
+        POST an encoded JSON body with the given bearer token.
+        
+        Args:
+            endpoint: Request URL
+            body: Encoded JSON body
+            token: Bearer token to send
+            
+        Returns:
+            Backend response
+        """
+        template = self._update_templates.get(endpoint)
+        if template is None:
+            # The Authorization header lives on the session (see _set_auth_token)
+            return self.session.post(endpoint, data=body, headers=JSON_HEADERS, timeout=self.timeout)
+        
+        # The template was prepared before login, so the token is added here
+        request = template.copy()
+        if token:
+            request.headers["Authorization"] = f"Bearer {token}"
+        request.body = body
+        request.prepare_content_length(body)
+        return self.session.send(request, timeout=self.timeout, **self._send_settings)
+    
     def _send_update_request(self, endpoint: str, data: Dict[str, Any]) -> bool:
         """Send update request to backend."""
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self._auth_token}"
-            }
+            self.logger.info("📤 Sending update to: %s", endpoint)
+            # Pretty-printing the payload is only worth it when DEBUG is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📋 Update data: %s", json.dumps(data, indent=2, ensure_ascii=False))
             
-            self.logger.info(f"📤 Sending update to: {endpoint}")
-            self.logger.debug(f"📋 Update data: {json.dumps(data, indent=2)}")
-            
-            response = requests.post(
-                endpoint,
-                json=data,
-                headers=headers,
-                timeout=self.timeout
-            )
+            response = self._post_authorized(endpoint, data)
             
             if response.status_code in [200, 201, 204]:
-                self.logger.info(f"✅ Backend update successful: {response.status_code}")
+                self.logger.info("✅ Backend update successful: %s", response.status_code)
                 return True
             else:
                 self.logger.error(f"❌ Backend update failed: {response.status_code} - {response.text}")
@@ -264,9 +567,6 @@ class BackendIntegrationService(IBackendNotifier):
         except requests.RequestException as e:
             self.logger.error(f"💥 Backend update request error: {str(e)}")
             return False
-        except Exception as e:
-            self.logger.error(f"💥 Backend update error: {str(e)}")
-            return False
     
     def get_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -282,15 +582,10 @@ class BackendIntegrationService(IBackendNotifier):
             if not self._authenticate():
                 return None
             
-            endpoint = f"{self.base_url}/api/User/{user_id}"
-            
-            headers = {
-                "Authorization": f"Bearer {self._auth_token}"
-            }
+            endpoint = self._url_user + str(user_id)
             
-            response = requests.get(
+            response = self.session.get(
                 endpoint,
-                headers=headers,
                 timeout=self.timeout
             )
             
@@ -300,16 +595,16 @@ class BackendIntegrationService(IBackendNotifier):
                 self.logger.error(f"❌ User data fetch failed: {response.status_code}")
                 return None
                 
-        except Exception as e:
+        except requests.RequestException as e:
             self.logger.error(f"💥 User data fetch error: {str(e)}")
             return None
     
     def test_connection(self) -> bool:
         """Test backend connection."""
         try:
-            endpoint = f"{self.base_url}/api/health"
+            endpoint = self._url_health
             
-            response = requests.get(endpoint, timeout=self.timeout)
+            response = self.session.get(endpoint, timeout=self.timeout)
             
             if response.status_code == 200:
                 self.logger.info("✅ Backend connection test successful")
@@ -318,6 +613,10 @@ class BackendIntegrationService(IBackendNotifier):
                 self.logger.error(f"❌ Backend connection test failed: {response.status_code}")
                 return False
                 
-        except Exception as e:
+        except requests.RequestException as e:
             self.logger.error(f"💥 Backend connection test error: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+    
+    def close(self) -> None:
+        """Close the pooled backend connections."""
+        self.session.close()
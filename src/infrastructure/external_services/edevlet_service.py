@@ -6,15 +6,84 @@ Direct port from original src/core/edevlet.py with enhancements
 import logging
 import time
 import os
-import platform
-from typing import Optional, Dict, Any, List
+import re
+import shutil
+import threading
+from typing import Optional, Dict, Any, List, Tuple
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlparse, unquote
 
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from urllib3.util.retry import Retry
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from ..browser import BrowserFactory, HumanBehaviorSimulator, StrategyFactory, ElementFinder
+from domain.value_objects.document_number import DocumentNumber
+from domain.value_objects.identity_number import IdentityNumber
+from ..browser import BrowserFactory, HumanBehaviorSimulator, StrategyFactory, ElementFinder, DriverPool
+
+# Verification page locators
+BARCODE_INPUT = (By.ID, "sorgulananBarkod")
+TC_INPUT = (By.ID, "tckn")
+TC_INPUT_ALT = (By.ID, "ikinciAlan")
+APPROVAL_CHECKBOX = (By.ID, "chkOnay")
+FIELD_ERROR = (By.CSS_SELECTOR, "div.formRow.required.errored")
+WARNING = (By.CSS_SELECTOR, "div.warningContainer")
+DOWNLOAD_LINK = (By.CSS_SELECTOR, "a.download")
+
+# verify_document() "error_type" values: bad input vs. E-Devlet not answering
+ERROR_TYPE_FORMAT = "format"
+ERROR_TYPE_UPSTREAM = "upstream"
+
+# Result page URLs that mean the document was verified
+SUCCESS_URL_RE = re.compile(r"belge=goster|belge-dogrulama")
+
+# Elements that signal each step of the flow has loaded
+FORM_READY = (BARCODE_INPUT,)
+TC_STEP_READY = (TC_INPUT, TC_INPUT_ALT, WARNING)
+APPROVAL_STEP_READY = (APPROVAL_CHECKBOX, FIELD_ERROR, WARNING)
+RESULT_READY = (DOWNLOAD_LINK, WARNING)
+
+# Page transitions on the verification form are fast; poll more often
+# than WebDriverWait's 500 ms default
+WAIT_POLL_FREQUENCY = 0.1
+
+# A directory listing taken within this window after the directory's mtime
+# may miss changes made in the same timestamp tick, so it is not cached
+SCAN_CACHE_RACY_NS = 1_000_000_000
+
+# Fills a form field and clicks submit in a single round-trip.
+# arguments[0]: candidate field ids, arguments[1]: value
+FILL_AND_SUBMIT_JS = """
+var field = null;
+for (var i = 0; i < arguments[0].length && !field; i++) {
+    field = document.getElementById(arguments[0][i]);
+}
+var button = document.querySelector('input.submitButton');
+if (!field || !button) {
+    return false;
+}
+field.value = arguments[1];
+field.dispatchEvent(new Event('input', {bubbles: true}));
+field.dispatchEvent(new Event('change', {bubbles: true}));
+button.click();
+return true;
+"""
+
+# Shared HTTP session for fallback downloads: keeps TLS connections alive
+# between verifications. Browser cookies are passed per request and the
+# jar never stores response cookies, so sessions of different users don't mix
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
 
 
 class EdevletService:
@@ -29,13 +98,14 @@ class EdevletService:
     - File download management
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    def __init__(self, headless: bool = True, timeout: int = 30, download_dir: Optional[str] = None):
         """
         Initialize E-Devlet service.
         
         Args:
             headless: Run browser in headless mode
             timeout: Maximum wait time for operations
+            download_dir: Directory for browser downloads (uses config default if None)
         """
         self.headless = headless
         self.timeout = timeout
@@ -44,43 +114,108 @@ class EdevletService:
         # Advanced browser components
         self.browser_factory = BrowserFactory()
         self.strategy_factory = StrategyFactory()
+        
+        # Each request thread keeps its own driver for the whole verification
+        self._local = threading.local()
         self.driver = None
         self.human_behavior = None
         self.element_finder = None
         
         # Download directory setup
-        self.download_dir = self._setup_download_directory()
+        from ..config.app_config import AppConfig
+        download_config = AppConfig.get_download_config()
+        self.download_root = self._setup_download_directory(download_dir or download_config["download_dir"])
+        self.storage_dir = self._setup_download_directory(download_config["storage_dir"])
+        
+        # Warm drivers reused across verifications
+        browser_config = AppConfig.get_browser_config()
+        self.cache_dir = browser_config["cache_dir"]
+        self.driver_pool = DriverPool(
+            self._create_driver,
+            size=browser_config["pool_size"],
+            max_uses=browser_config["max_uses"]
+        )
+        
+        # Human-like typing/clicking instead of direct form fills
+        self.human_mode = browser_config["human_mode"]
         
         self.logger.info("🌐 EdevletService initialized")
         self.logger.info(f"📁 Download directory: {self.download_dir}")
-        self.logger.info(f"🖥️ Operating System: {platform.system()} {platform.machine()}")
+        platform_config = AppConfig.get_platform_config()
+        self.logger.info(f"🖥️ Operating System: {platform_config['system']} {platform_config['machine']}")
     
-    def _setup_download_directory(self) -> str:
+    @property
+    def driver(self):
+        """WebDriver checked out by the current thread."""
+        return getattr(self._local, "driver", None)
+    
+    @driver.setter
+    def driver(self, value) -> None:
+        self._local.driver = value
+    
+    @property
+    def human_behavior(self) -> Optional[HumanBehaviorSimulator]:
+        """Human behavior simulator bound to the current thread's driver."""
+        return getattr(self._local, "human_behavior", None)
+    
+    @human_behavior.setter
+    def human_behavior(self, value: Optional[HumanBehaviorSimulator]) -> None:
+        self._local.human_behavior = value
+    
+    @property
+    def element_finder(self) -> Optional[ElementFinder]:
+        """Element finder bound to the current thread's driver."""
+        return getattr(self._local, "element_finder", None)
+    
+    @element_finder.setter
+    def element_finder(self, value: Optional[ElementFinder]) -> None:
+        self._local.element_finder = value
+    
+    @property
+    def download_dir(self) -> str:
+        """Download directory of the current thread's driver (download root if none)."""
+        return getattr(self._local, "download_dir", self.download_root)
+    
+    def _setup_download_directory(self, download_dir: str) -> str:
         """Setup download directory for documents."""
-        download_dir = os.path.join(os.getcwd(), "downloads")
-        if not os.path.exists(download_dir):
-            os.makedirs(download_dir)
+        os.makedirs(download_dir, exist_ok=True)
         return download_dir
     
+    def _slot_download_dir(self, slot: int) -> str:
+        """Download directory of a pool slot (parallel verifications never share one)."""
+        return os.path.join(self.download_root, f"slot-{slot}")
+    
+    def _create_driver(self, slot: int):
+        """Create advanced browser with anti-detection (used by the driver pool)."""
+        self.logger.info(f"🚀 Starting WebDriver for pool slot {slot}...")
+        
+        # Concurrent Chrome instances cannot share a profile, so each slot gets its own
+        profile_dir = os.path.join(self.cache_dir, f"slot-{slot}") if self.cache_dir else None
+        
+        return self.browser_factory.create_stealth_browser(
+            headless=self.headless,
+            timeout=self.timeout,
+            download_dir=self._setup_download_directory(self._slot_download_dir(slot)),
+            profile_dir=profile_dir
+        )
+    
     def _init_browser(self) -> bool:
         """Initialize advanced Chrome browser with stealth features."""
         try:
-            self.logger.info("🚀 Starting WebDriver with advanced configuration...")
-            
-            # Create advanced browser with anti-detection
-            self.driver = self.browser_factory.create_stealth_browser(
-                headless=self.headless,
-                timeout=self.timeout,
-                download_dir=self.download_dir
-            )
+            # Borrow a warm browser from the pool (created on first use)
+            self.driver = self.driver_pool.checkout()
+            slot = self.driver_pool.slot_of(self.driver)
+            self._local.download_dir = self._slot_download_dir(slot) if slot else self.download_root
+            # (dir mtime_ns, scan time_ns, names) of the last download directory listing
+            self._local.scan_cache = None
             
             # Initialize human behavior simulator
-            self.human_behavior = HumanBehaviorSimulator(self.driver)
+            self.human_behavior = HumanBehaviorSimulator(self.driver, human_mode=self.human_mode)
             
             # Initialize element finder with strategies
             self.element_finder = ElementFinder(self.driver, self.strategy_factory)
             
-            self.logger.info("✅ WebDriver started successfully with stealth features")
+            self.logger.info("✅ WebDriver ready with stealth features")
             return True
             
         except Exception as e:
@@ -98,26 +233,63 @@ class EdevletService:
         Returns:
             Dict with verification results
         """
+        # Reject malformed input before paying for a browser session
+        format_error = self._validate_input_format(barcode_number, tc_kimlik_no)
+        if format_error:
+            self.logger.warning(f"❌ {format_error}")
+            return {
+                "success": False,
+                "error": format_error,
+                "error_type": ERROR_TYPE_FORMAT,
+                "files": []
+            }
+        
         if not self._init_browser():
             return {
                 "success": False,
                 "error": "Browser initialization failed",
+                "error_type": ERROR_TYPE_UPSTREAM,
                 "files": []
             }
         
+        browser_failed = False
         try:
             result = self._perform_full_verification(barcode_number, tc_kimlik_no)
             return result
             
         except Exception as e:
             self.logger.error(f"💥 Document verification error: {str(e)}")
-            return {
+            browser_failed = isinstance(e, WebDriverException)
+            result = {
                 "success": False,
                 "error": f"Verification process failed: {str(e)}",
                 "files": []
             }
+            # Timeouts and driver errors say nothing about the document itself
+            if browser_failed:
+                result["error_type"] = ERROR_TYPE_UPSTREAM
+            return result
         finally:
-            self._cleanup_browser()
+            self._cleanup_browser(discard=browser_failed)
+    
+    def _validate_input_format(self, barcode_number: str, tc_kimlik_no: str) -> Optional[str]:
+        """
+        Check barcode and TC Kimlik No format locally.
+        
+        Returns:
+            Error message if either value is malformed, None otherwise
+        """
+        try:
+            DocumentNumber.create(barcode_number)
+        except ValueError:
+            return "Geçersiz barkod numarası"
+        
+        try:
+            IdentityNumber.create(tc_kimlik_no)
+        except ValueError:
+            return "Geçersiz TC Kimlik numarası"
+        
+        return None
     
     def _perform_full_verification(self, barcode_number: str, tc_kimlik_no: str) -> Dict[str, Any]:
         """Perform the complete verification flow."""
@@ -126,75 +298,73 @@ class EdevletService:
         verification_config = AppConfig.get_verification_config()
         verification_url = verification_config["url"]
         self.logger.info(f"🌐 Navigating to E-Devlet verification page: {verification_url}")
-        self.driver.get(verification_url)
-        
-        # Human behavior after page load
-        self.human_behavior.random_sleep(2, 4)
+        self._navigate_and_wait(verification_url, FORM_READY)
         self.human_behavior.simulate_human_behavior()
         
         # Step 2: Enter barcode number
         self.logger.info(f"📋 Entering barcode number: {barcode_number}")
-        barcode_input = self.element_finder.find_element_by_type("barcode_input")
-        
-        if not barcode_input:
-            return {
-                "success": False,
-                "error": "Barcode input field not found",
-                "files": []
-            }
-        
-        # Human-like typing
-        self.human_behavior.human_like_type(barcode_input, barcode_number)
         
-        # Find and click submit button
-        self.logger.info("🖱️ Clicking submit button...")
-        submit_button = self.element_finder.find_element_by_type("submit_button")
-        
-        if not submit_button:
-            return {
-                "success": False,
-                "error": "Submit button not found",
-                "files": []
-            }
-        
-        self.human_behavior.human_like_click(submit_button)
-        self.logger.info("✅ Submit button clicked successfully")
+        if self._fill_and_submit((BARCODE_INPUT[1],), barcode_number):
+            self.logger.info("✅ Barcode submitted")
+        else:
+            barcode_input = self.element_finder.find_element_by_type("barcode_input")
+            
+            if not barcode_input:
+                return {
+                    "success": False,
+                    "error": "Barcode input field not found",
+                    "files": []
+                }
+            
+            # Human-like typing
+            self.human_behavior.human_like_type(barcode_input, barcode_number)
+            
+            # Find and click submit button
+            self.logger.info("🖱️ Clicking submit button...")
+            if not self._click_submit():
+                return {
+                    "success": False,
+                    "error": "Submit button not found",
+                    "files": []
+                }
+            
+            self.logger.info("✅ Submit button clicked successfully")
         
-        # Wait for page transition
-        self.human_behavior.random_sleep(1, 2)
+        # Wait for the TC Kimlik field (or the invalid barcode warning)
+        self._wait_for_any(TC_STEP_READY)
         
         # Step 3: Enter TC Kimlik No
         self.logger.info(f"🆔 Entering TC Kimlik No: {tc_kimlik_no[:3]}****{tc_kimlik_no[7:]}")
         
-        # Wait for second input field
-        tc_input = self.element_finder.find_element_by_type("tc_kimlik_input")
-        
-        if not tc_input:
-            return {
-                "success": False,
-                "error": "TC Kimlik input field not found",
-                "files": []
-            }
-        
-        # Human-like typing
-        self.human_behavior.human_like_type(tc_input, tc_kimlik_no)
-        
-        # Find and click submit button again
-        self.logger.info("🖱️ Clicking submit button for TC Kimlik...")
-        submit_button = self.element_finder.find_element_by_type("submit_button")
-        
-        if not submit_button:
-            return {
-                "success": False,
-                "error": "Second submit button not found",
-                "files": []
-            }
-        
-        self.human_behavior.human_like_click(submit_button)
-        self.logger.info("✅ TC Kimlik submit button clicked")
+        if self._fill_and_submit((TC_INPUT[1], TC_INPUT_ALT[1]), tc_kimlik_no):
+            self.logger.info("✅ TC Kimlik submitted")
+        else:
+            # Wait for second input field
+            tc_input = self.element_finder.find_element_by_type("tc_kimlik_input")
+            
+            if not tc_input:
+                return {
+                    "success": False,
+                    "error": "TC Kimlik input field not found",
+                    "files": []
+                }
+            
+            # Human-like typing
+            self.human_behavior.human_like_type(tc_input, tc_kimlik_no)
+            
+            # Find and click submit button again
+            self.logger.info("🖱️ Clicking submit button for TC Kimlik...")
+            if not self._click_submit():
+                return {
+                    "success": False,
+                    "error": "Second submit button not found",
+                    "files": []
+                }
+            
+            self.logger.info("✅ TC Kimlik submit button clicked")
         
-        # Wait for next page
-        self.human_behavior.random_sleep(3, 5)
+        # Wait for either the approval checkbox or a validation error
+        self._wait_for_any(APPROVAL_STEP_READY)
 
         # Step 4: Handle checkbox if present
         self.logger.info("☑️ Looking for checkbox...")
@@ -202,37 +372,115 @@ class EdevletService:
         
         if checkbox:
             self.logger.info("☑️ Checkbox found, clicking...")
-            self.human_behavior.human_like_click(checkbox)
+            self.human_behavior.human_like_click(checkbox, pointer_events=self.human_mode)
             self.logger.info("✅ Checkbox clicked")
             
-            # Wait a bit
-            self.human_behavior.random_sleep(2, 3)
-            
-            # Find final submit button
-            final_submit = self.element_finder.find_element_by_type("submit_button")
-            if final_submit:
-                self.logger.info("🖱️ Clicking final submit button...")
-                self.human_behavior.human_like_click(final_submit)
+            # Find and click final submit button
+            self.logger.info("🖱️ Clicking final submit button...")
+            if self._click_submit():
                 self.logger.info("✅ Final submit button clicked")
         else:
             self.logger.info("ℹ️ No checkbox found, proceeding...")
         
-        # Wait for final result
-        self.human_behavior.random_sleep(3, 5)
+        # Wait for the result page (download link or warning)
+        self._wait_for_any(RESULT_READY)
         
         # Step 5: Check result and handle downloads
         return self._handle_verification_result()
     
+    def _fill_and_submit(self, field_ids: Tuple[str, ...], value: str) -> bool:
+        """
+        Fill a form field and click submit with a single script call.
+        
+        Args:
+            field_ids: Candidate ids of the input field, tried in order
+            value: Value to enter
+            
+        Returns:
+            True if the form was submitted, False if human mode is enabled
+            or the elements were not found (caller falls back to the
+            strategy-based human-like path)
+        """
+        if self.human_mode:
+            return False
+        
+        try:
+            return bool(self.driver.execute_script(FILL_AND_SUBMIT_JS, list(field_ids), value))
+        except WebDriverException as e:
+            self.logger.warning(f"⚠️ Direct form fill failed: {str(e)}")
+            return False
+    
+    def _click_submit(self) -> bool:
+        """
+        Resolve the submit button once and click it.
+        
+        Returns:
+            True if the button was found and clicked
+        """
+        submit_button = self.element_finder.find_element_by_type("submit_button")
+        if not submit_button:
+            return False
+        
+        # human_like_click falls back to a JavaScript click on its own
+        self.human_behavior.human_like_click(submit_button, pointer_events=self.human_mode)
+        return True
+    
+    def _navigate_and_wait(self, url: str, locators: Tuple[Tuple[str, str], ...]) -> bool:
+        """
+        Navigate to a URL and wait until one of the given elements is present.
+        
+        Page.navigate returns as soon as the navigation starts, so the element
+        wait replaces driver.get()'s wait for the load event instead of
+        following it. Falls back to driver.get() when CDP is unavailable.
+        
+        Args:
+            url: Page to open
+            locators: (By, value) tuples of the elements the page must show
+            
+        Returns:
+            True if one of the elements appeared, False on timeout
+        """
+        try:
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        except WebDriverException as e:
+            self.logger.debug(f"🔄 CDP navigation unavailable, using driver.get: {str(e)}")
+            self.driver.get(url)
+        
+        return self._wait_for_any(locators, timeout=self.timeout)
+    
+    def _wait_for_any(self, locators: Tuple[Tuple[str, str], ...], timeout: int = 10) -> bool:
+        """
+        Wait until any of the given elements is present.
+        
+        Args:
+            locators: (By, value) tuples of the elements the next step needs
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            True if one of the elements appeared, False on timeout
+        """
+        try:
+            # Most of the candidates are expected to be missing, so skip the
+            # implicit wait to let each poll check every locator immediately
+            with self.element_finder.without_implicit_wait():
+                WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.any_of(*(EC.presence_of_element_located(locator) for locator in locators))
+                )
+            return True
+        except TimeoutException:
+            self.logger.warning(f"⏰ None of {len(locators)} expected elements appeared within {timeout}s")
+            return False
+    
     def _handle_verification_result(self) -> Dict[str, Any]:
         """Handle the verification result and file downloads."""
         current_url = self.driver.current_url
         self.logger.info(f"📍 Current URL: {current_url}")
         
-        if "belge=goster" in current_url or "belge-dogrulama" in current_url:
+        if SUCCESS_URL_RE.search(current_url):
             self.logger.info("✅ Verification successful! Result page reached.")
             
             # Try to download files
-            downloaded_files = self._download_verification_files()
+            downloaded_files = self._archive_downloaded_files(self._download_verification_files())
             
             return {
                 "success": True,
@@ -272,42 +520,36 @@ class EdevletService:
             # Look for download link
             self.logger.info("🔍 Looking for download link...")
             
-            download_link = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a.download"))
+            download_link = WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                EC.presence_of_element_located(DOWNLOAD_LINK)
             )
             
             download_link_url = download_link.get_attribute("href")
             self.logger.info(f"📎 Download link found: {download_link_url}")
             
+            # Snapshot before clicking so only this download is picked up
+            existing_files = self._snapshot_download_dir()
+            
             # Click download link with human behavior
-            self.human_behavior.human_like_click(download_link)
+            self.human_behavior.human_like_click(download_link, pointer_events=self.human_mode)
             self.logger.info("✅ Download link clicked")
             
             # Wait for download to complete
-            self.human_behavior.random_sleep(3, 5)
-            
-            # Check downloaded files
-            pdf_files = self._check_downloaded_files()
+            pdf_files = self._wait_for_new_pdf(existing_files, timeout=10)
             
             if pdf_files:
                 self.logger.info(f"📄 Downloaded {len(pdf_files)} PDF files:")
-                for pdf_file in pdf_files:
-                    full_path = os.path.join(self.download_dir, pdf_file)
-                    file_size = os.path.getsize(full_path) / 1024  # KB
-                    self.logger.info(f"  - {pdf_file} ({file_size:.2f} KB)")
-                    downloaded_files.append(full_path)
+                for pdf_file, file_size in self._check_downloaded_files(pdf_files):
+                    self.logger.info(f"  - {pdf_file} ({file_size / 1024:.2f} KB)")
+                    downloaded_files.append(os.path.join(self.download_dir, pdf_file))
             else:
                 # Try alternative download method
                 self.logger.info("📥 Trying alternative download method...")
-                self.driver.get(download_link_url)
-                self.human_behavior.random_sleep(5, 7)
+                full_path = self._download_with_browser_session(download_link_url)
                 
-                pdf_files = self._check_downloaded_files()
-                if pdf_files:
-                    self.logger.info(f"📄 Downloaded via alternative method: {len(pdf_files)} files")
-                    for pdf_file in pdf_files:
-                        full_path = os.path.join(self.download_dir, pdf_file)
-                        downloaded_files.append(full_path)
+                if full_path:
+                    self.logger.info(f"📄 Downloaded via alternative method: {os.path.basename(full_path)}")
+                    downloaded_files.append(full_path)
                 else:
                     self.logger.warning("❌ No PDF files downloaded")
             
@@ -318,16 +560,157 @@ class EdevletService:
         
         return downloaded_files
     
-    def _check_downloaded_files(self) -> List[str]:
-        """Check for downloaded PDF files."""
+    def _archive_downloaded_files(self, paths: List[str]) -> List[str]:
+        """
+        Move downloaded files to persistent storage.
+        
+        The move finishes before the verification result is built, so the
+        result (and the backend notification) only lists files that exist.
+        
+        Args:
+            paths: Files in the download directory
+            
+        Returns:
+            Paths where the files now are: the storage directory, or the
+            download directory for files that could not be moved
+        """
+        if os.path.abspath(self.download_dir) == os.path.abspath(self.storage_dir):
+            return paths
+        
+        archived_paths = []
+        for path in paths:
+            destination = os.path.join(self.storage_dir, os.path.basename(path))
+            final_path = _move_file(path, destination)
+            if final_path:
+                archived_paths.append(final_path)
+        
+        return archived_paths
+    
+    def _download_with_browser_session(self, url: str) -> Optional[str]:
+        """
+        Fetch a file over HTTP reusing the browser's cookies.
+        
+        Args:
+            url: Download link URL
+            
+        Returns:
+            Full path of the saved file, or None on failure
+        """
+        if not url:
+            return None
+        
+        try:
+            # Keep each cookie's domain and path, so redirects to other hosts
+            # never receive the e-Devlet session
+            cookies = RequestsCookieJar()
+            for cookie in self.driver.get_cookies():
+                cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain"),
+                    path=cookie.get("path", "/"),
+                    secure=cookie.get("secure", False)
+                )
+            headers = {"User-Agent": self.driver.execute_script("return navigator.userAgent")}
+            
+            with _SESSION.get(url, cookies=cookies, headers=headers, stream=True, timeout=(5, 30)) as response:
+                response.raise_for_status()
+                
+                filename = self._filename_from_response(response, url)
+                full_path = os.path.join(self.download_dir, filename)
+                
+                with open(full_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+            
+            return full_path
+            
+        except Exception as e:
+            self.logger.error(f"💥 Session download error: {str(e)}")
+            return None
+    
+    def _filename_from_response(self, response: requests.Response, url: str) -> str:
+        """Pick a file name from Content-Disposition, falling back to the URL."""
+        disposition = response.headers.get("Content-Disposition", "")
+        match = re.search(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)"?', disposition)
+        
+        filename = unquote(match.group(1)) if match else os.path.basename(urlparse(url).path)
+        filename = os.path.basename(filename) or f"belge_{int(time.time())}"
+        
+        if not filename.lower().endswith(".pdf"):
+            filename += ".pdf"
+        return filename
+    
+    def _check_downloaded_files(self, names: Optional[set] = None) -> List[Tuple[str, int]]:
+        """
+        Check for downloaded PDF files.
+        
+        Args:
+            names: Only report these file names (all PDFs if None)
+            
+        Returns:
+            (file name, size in bytes) pairs
+        """
         try:
-            downloaded_files = os.listdir(self.download_dir)
-            pdf_files = [f for f in downloaded_files if f.endswith('.pdf')]
-            return pdf_files
+            with os.scandir(self.download_dir) as entries:
+                return [
+                    (entry.name, entry.stat().st_size)
+                    for entry in entries
+                    if entry.name.endswith('.pdf') and (names is None or entry.name in names)
+                ]
         except Exception as e:
             self.logger.error(f"💥 Error checking downloaded files: {str(e)}")
             return []
     
+    def _snapshot_download_dir(self, force: bool = False) -> frozenset:
+        """
+        Names currently present in the download directory.
+        
+        The listing is cached against the directory's mtime, so repeated
+        polls of an unchanged directory cost a single stat().
+        
+        Args:
+            force: Rescan even if the directory looks unchanged
+        """
+        mtime_ns = os.stat(self.download_dir).st_mtime_ns
+        
+        cached = getattr(self._local, "scan_cache", None)
+        if not force and cached and cached[0] == mtime_ns and cached[1] - mtime_ns > SCAN_CACHE_RACY_NS:
+            return cached[2]
+        
+        scanned_at = time.time_ns()
+        with os.scandir(self.download_dir) as entries:
+            names = frozenset(entry.name for entry in entries)
+        
+        self._local.scan_cache = (mtime_ns, scanned_at, names)
+        return names
+    
+    def _wait_for_new_pdf(self, before: frozenset, timeout: float = 30) -> set:
+        """
+        Poll the download directory until a new PDF has finished downloading.
+        
+        Args:
+            before: Snapshot taken with _snapshot_download_dir() before the download started
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            Names of the new PDF files (empty if none appeared in time)
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            new_files = self._snapshot_download_dir() - before
+            
+            # Chrome writes to *.crdownload and renames when the download completes
+            if new_files and not any(name.endswith('.crdownload') for name in new_files):
+                pdf_files = {name for name in new_files if name.endswith('.pdf')}
+                if pdf_files:
+                    return pdf_files
+            
+            if time.monotonic() >= deadline:
+                return set()
+            time.sleep(0.1)
+    
     def _extract_error_message(self) -> str:
         """Extract error message from error page."""
         try:
@@ -357,36 +740,55 @@ class EdevletService:
             self.logger.error(f"💥 Error message extraction failed: {str(e)}")
             return "Error message could not be extracted"
     
-    def _cleanup_browser(self) -> None:
-        """Clean up browser resources."""
+    def _cleanup_browser(self, discard: bool = False) -> None:
+        """
+        Return the browser to the pool.
+        
+        Args:
+            discard: Quit the browser instead of reusing it (e.g. after a driver error)
+        """
         try:
             if self.driver:
-                self.driver.quit()
-                self.logger.info("🔄 WebDriver closed")
+                self.driver_pool.checkin(self.driver, discard=discard)
+                self.logger.info("🔄 WebDriver returned to pool")
         except Exception as e:
             self.logger.error(f"💥 Browser cleanup error: {str(e)}")
+        finally:
+            self.driver = None
+            self._local.download_dir = self.download_root
+    
+    def warm_up(self) -> None:
+        """Start the pooled browsers now instead of on the first verifications."""
+        self.driver_pool.warm_up()
+    
+    def close(self) -> None:
+        """Quit all pooled browsers."""
+        self.driver_pool.shutdown()
     
     def get_download_directory_info(self) -> Dict[str, Any]:
         """Get information about the download directory."""
         try:
-            files = os.listdir(self.download_dir)
-            pdf_files = [f for f in files if f.endswith('.pdf')]
-            
+            total_files = 0
             file_info = []
-            for pdf_file in pdf_files:
-                full_path = os.path.join(self.download_dir, pdf_file)
-                stat = os.stat(full_path)
-                file_info.append({
-                    "name": pdf_file,
-                    "path": full_path,
-                    "size_kb": stat.st_size / 1024,
-                    "modified": time.ctime(stat.st_mtime)
-                })
+            
+            with os.scandir(self.download_dir) as entries:
+                for entry in entries:
+                    total_files += 1
+                    if not entry.name.endswith('.pdf'):
+                        continue
+                    
+                    stat = entry.stat()
+                    file_info.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size_kb": stat.st_size / 1024,
+                        "modified": time.ctime(stat.st_mtime)
+                    })
             
             return {
                 "directory": self.download_dir,
-                "total_files": len(files),
-                "pdf_files": len(pdf_files),
+                "total_files": total_files,
+                "pdf_files": len(file_info),
                 "files": file_info
             }
             
@@ -395,4 +797,19 @@ class EdevletService:
             return {
                 "directory": self.download_dir,
                 "error": str(e)
-            } 
\ No newline at end of file
+            } 
+
+
+def _move_file(source: str, destination: str) -> Optional[str]:
+    """
+    Move a downloaded file, logging instead of raising.
+    
+    Returns:
+        Path the file ends up at (source if the move failed), or None if it is gone
+    """
+    try:
+        shutil.move(source, destination)
+        return destination
+    except Exception as e:
+        logging.getLogger(__name__).error(f"💥 Could not move {source} to {destination}: {str(e)}")
+        return source if os.path.exists(source) else None
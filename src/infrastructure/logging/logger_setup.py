@@ -1,23 +1,26 @@
+import atexit
 import logging
-import sys
+import queue
 import os
-from logging.handlers import RotatingFileHandler
+from datetime import datetime
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pythonjsonlogger import jsonlogger
 import logging.config
-import json
 from typing import Optional
 
-from infrastructure.config.app_config import AppConfig
-
 # Proje kök dizinini bularak 'logs' klasörünün yolunu doğru bir şekilde belirle
 # __file__ -> src_clean/infrastructure/logging/logger_setup.py
 # dirname(__file__) -> src_clean/infrastructure/logging
 # dirname(dirname(dirname...))) -> edevlet-automazition
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'logs')
 
-# Log klasörü yoksa oluştur
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+# Log klasörü import sırasında değil, setup_logging çağrıldığında oluşturulur
+
+# Arka planda handler'ları çalıştıran dinleyici (setup_logging tarafından başlatılır)
+_queue_listener: Optional[QueueListener] = None
+
+# setup_logging'in en son kurduğu log dosyası; aynı dosya için tekrar çağrı bir şey yapmaz
+_configured_log_file: Optional[str] = None
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Okunabilir JSON formatlayıcısı - insan dostu zaman formatı ile."""
@@ -25,7 +28,6 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
         
         # İnsan dostu zaman formatı ekle
-        from datetime import datetime
         dt = datetime.fromtimestamp(record.created)
         log_record['time'] = dt.strftime('%Y-%m-%d %H:%M:%S')
         log_record['unix_timestamp'] = record.created
@@ -49,6 +51,44 @@ def _create_handler(filename: str, max_bytes: int = 10*1024*1024, backup_count:
     handler.setFormatter(formatter)
     return handler
 
+class _PassthroughQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records as they are.
+    
+    The stock prepare() formats the record on the calling thread and folds
+    the traceback into the message; here the listener's handlers do all the
+    formatting, so CustomJsonFormatter still sees exc_info.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _install_queue_listener() -> None:
+    """
+    Move the root handlers behind a QueueHandler.
+
+    Formatting and file/console writes run on the listener thread, so
+    logging calls on request threads only enqueue the record.
+    """
+    global _queue_listener
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    else:
+        atexit.register(lambda: _queue_listener and _queue_listener.stop())
+
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(_PassthroughQueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
 def setup_logging(log_path: Optional[str] = None) -> None:
     """
     Set up application-wide logging with JSON format.
@@ -56,17 +96,23 @@ def setup_logging(log_path: Optional[str] = None) -> None:
     Args:
         log_path: Optional path to a specific log file.
                   If not provided, defaults to 'app.log' in the configured LOGS_DIR.
+                  Calling again with the same file is a no-op.
     """
-    # Ensure logs directory exists
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR, exist_ok=True)
-        
+    global _configured_log_file
+
     # Determine log file path
     if log_path:
         default_log_file = log_path
     else:
         default_log_file = os.path.join(LOG_DIR, "app.log")
 
+    # Already set up for this file: keep the running handlers and listener
+    if _configured_log_file == default_log_file:
+        return
+
+    # Ensure logs directory exists
+    os.makedirs(LOG_DIR, exist_ok=True)
+
     # Base logging configuration
     logging_config = {
         "version": 1,
@@ -99,5 +145,7 @@ def setup_logging(log_path: Optional[str] = None) -> None:
     }
 
     logging.config.dictConfig(logging_config)
+    _install_queue_listener()
+    _configured_log_file = default_log_file
 
     logging.getLogger('root').info("Yapılandırılmış, çoklu dosya loglama sistemi başarıyla kuruldu.") 
\ No newline at end of file
@@ -5,9 +5,11 @@ Clean Architecture - Concrete implementation of domain repository interface
 import sqlite3
 import logging
 import json
+import os
+import threading
+import weakref
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
-from pathlib import Path
 
 from domain.entities.event import Event, EventStatus
 from domain.value_objects.event_type import EventType
@@ -28,12 +30,43 @@ class SqliteEventRepository(IEventRepository):
         """Initialize repository and create tables if they don't exist."""
         self.db_path = db_path
         self.logger = logging.getLogger("queue")
+        
+        # One connection per thread, reused across calls (sqlite3 connections
+        # must not be shared between threads)
+        self._local = threading.local()
         self._init_db()
+        
+        # A forked child must not reuse the parent's connections; it opens its own
+        repo_ref = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: repo_ref() and repo_ref()._reset_connections())
+    
+    def _reset_connections(self) -> None:
+        """Forget the connections inherited from the parent process (without closing them)."""
+        self._local = threading.local()
+    
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's database connection, opening it on first use.
+        
+        Use as `with self._create_connection() as conn:` - the context manager
+        commits or rolls back the transaction but keeps the connection open.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            
+            # WAL lets the API thread write while the background processor reads
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            
+            self._local.conn = conn
+        return conn
     
     def _init_db(self) -> None:
         """Create database tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create events table
@@ -70,7 +103,7 @@ class SqliteEventRepository(IEventRepository):
         """Save event to database."""
         is_new = event.id is None
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 
                 if is_new:
@@ -82,9 +115,9 @@ class SqliteEventRepository(IEventRepository):
                         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         event.user_id,
-                        str(event.identity_number),
+                        event.identity_number.value,
                         event.event_type.value,
-                        str(event.document_number) if event.document_number else None,
+                        event.document_number.value if event.document_number else None,
                         event.status.value,
                         event.retry_count,
                         json.dumps(event.event_data) if event.event_data else None,
@@ -133,8 +166,7 @@ class SqliteEventRepository(IEventRepository):
     def find_by_id(self, event_id: int) -> Optional[Event]:
         """Find event by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
@@ -155,8 +187,7 @@ class SqliteEventRepository(IEventRepository):
         """Find pending events for processing."""
         self.logger.debug("Searching for pending events", extra={"limit": limit})
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -174,6 +205,37 @@ class SqliteEventRepository(IEventRepository):
             self.logger.error("Error finding pending events", exc_info=True)
             raise
     
+    def claim_pending_events(self, limit: int = 10) -> List[Event]:
+        """Claim the oldest pending events in one write transaction."""
+        conn = self._create_connection()
+        try:
+            # IMMEDIATE takes the write lock up front, so two workers cannot
+            # select the same rows before either has updated them
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("""
+                UPDATE events SET status = 'processing', updated_at = ?
+                WHERE id IN (
+                    SELECT id FROM events 
+                    WHERE status = 'new' 
+                    ORDER BY created_at ASC 
+                    LIMIT ?
+                )
+                RETURNING *
+            """, (datetime.now().isoformat(), limit)).fetchall()
+            conn.commit()
+            
+        except Exception as e:
+            conn.rollback()
+            self.logger.error("Error claiming pending events", exc_info=True)
+            raise
+        
+        self.logger.info(f"Claimed {len(rows)} pending events.", extra={"count": len(rows), "limit": limit})
+        
+        # RETURNING does not preserve the subquery's order
+        events = [self._row_to_event(row) for row in rows]
+        events.sort(key=lambda event: event.created_at)
+        return events
+    
     def find_failed_events_for_retry(self, max_retries: int = 3, limit: int = 10) -> List[Event]:
         """Find failed events eligible for retry."""
         query = """
@@ -194,6 +256,44 @@ class SqliteEventRepository(IEventRepository):
         event.updated_at = datetime.now()
         self.save(event)
     
+    def update_status_bulk(self, events: List[Event]) -> None:
+        """Update the status of several events in a single transaction."""
+        if not events:
+            return
+        
+        now = datetime.now()
+        for event in events:
+            event.updated_at = now
+        
+        try:
+            with self._create_connection() as conn:
+                conn.executemany("""
+                    UPDATE events SET
+                        status = ?, retry_count = ?, updated_at = ?,
+                        processed_at = ?, error_message = ?
+                    WHERE id = ?
+                """, [
+                    (
+                        event.status.value,
+                        event.retry_count,
+                        event.updated_at.isoformat(),
+                        event.processed_at.isoformat() if event.processed_at else None,
+                        event.error_message,
+                        event.id
+                    )
+                    for event in events
+                ])
+                
+                self.logger.info("Event statuses updated in bulk", extra={"count": len(events)})
+                
+        except Exception as e:
+            self.logger.error(
+                "Error updating event statuses in bulk",
+                extra={"event_ids": [event.id for event in events]},
+                exc_info=True
+            )
+            raise
+    
     def count_by_status(self, status: EventStatus) -> int:
         """Count events by status."""
         query = "SELECT COUNT(*) FROM events WHERE status = ?;"
@@ -208,7 +308,7 @@ class SqliteEventRepository(IEventRepository):
     def get_statistics(self) -> Dict[str, Any]:
         """Get repository statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Count events by status
@@ -247,7 +347,7 @@ class SqliteEventRepository(IEventRepository):
         try:
             cutoff_date = datetime.now() - timedelta(days=days_old)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -269,7 +369,7 @@ class SqliteEventRepository(IEventRepository):
     def _get_retried_events(self):
         """Get events that have been retried."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._create_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT id FROM events WHERE retry_count > 0")
                 return cursor.fetchall()
@@ -3,7 +3,6 @@ Background Scheduler - Infrastructure Layer
 Simple background task scheduler
 """
 import logging
-import time
 import threading
 from datetime import datetime, timedelta
 from typing import Optional, Callable
@@ -76,12 +75,12 @@ class BackgroundScheduler:
         while self.is_running and not self.stop_event.is_set():
             try:
                 schedule.run_pending()
-                # Check every minute
-                time.sleep(60)
+                # Check every minute (wakes up immediately on stop)
+                self.stop_event.wait(60)
                 
             except Exception as e:
                 self.logger.error(f"💥 Scheduler loop error: {str(e)}", exc_info=True)
-                time.sleep(60)  # Continue after error
+                self.stop_event.wait(60)  # Continue after error
         
         self.logger.info("🔄 Scheduler loop ended")
     
@@ -3,6 +3,7 @@
 E-Devlet Automation Service
 Simple Flask API + Background Job + Daemon Mode
 """
+import ipaddress
 import os
 import signal
 import sys
@@ -20,14 +21,21 @@ from domain.value_objects.event_type import EventType
 
 # Application imports
 from application.use_cases.receive_event_use_case import ReceiveEventUseCase
-from application.use_cases.process_document_use_case import ProcessDocumentUseCase, ValidationResult
+from application.use_cases.process_document_use_case import (
+    ProcessDocumentUseCase, ValidationResult, StatusWriteError,
+    ERR_INVALID_FORMAT, ERR_UPSTREAM_UNAVAILABLE, ERR_VALIDATOR, ERR_ADAPTER
+)
+from application.use_cases.verification_cache import VerificationCache
+from application.use_cases.circuit_breaker import CircuitBreaker
+from application.services.repository_write_queue import RepositoryWriteQueue
+from application.services.document_verification_application_service import DocumentVerificationApplicationService
 
 # Infrastructure imports
-from infrastructure.config.app_config import AppConfig
+from infrastructure.config.app_config import AppConfig, env_bool, env_int, load_compiled_env
 from infrastructure.logging.logger_setup import setup_logging
 from infrastructure.repositories.sqlite_event_repository import SqliteEventRepository
 from infrastructure.scheduling.background_scheduler import BackgroundScheduler
-from infrastructure.external_services.edevlet_service import EdevletService
+from infrastructure.external_services.edevlet_service import EdevletService, ERROR_TYPE_FORMAT, ERROR_TYPE_UPSTREAM
 from infrastructure.external_services.backend_integration_service import BackendIntegrationService
 
 
@@ -48,21 +56,48 @@ class EdevletServiceAdapter:
                     message=result.get("message", "Verification successful"),
                     files=result.get("files", [])
                 )
+            
+            error_type = result.get("error_type")
+            if error_type == ERROR_TYPE_FORMAT:
+                return ValidationResult.failure_result(
+                    message=result.get("error", "Invalid input format"),
+                    error_code=ERR_INVALID_FORMAT
+                )
+            elif error_type == ERROR_TYPE_UPSTREAM:
+                return ValidationResult.failure_result(
+                    message=result.get("error", "E-Devlet unavailable"),
+                    error_code=ERR_UPSTREAM_UNAVAILABLE
+                )
             else:
                 return ValidationResult.failure_result(
                     message=result.get("error", "Verification failed"),
-                    error_code="EDEVLET_ERROR"
+                    error_code=ERR_VALIDATOR
                 )
         except Exception as e:
             self.logger.error(f"EdevletService adapter error: {str(e)}")
             return ValidationResult.failure_result(
                 message=f"Adapter error: {str(e)}",
-                error_code="ADAPTER_ERROR"
+                error_code=ERR_ADAPTER
             )
+    
+    def warm_up(self) -> None:
+        """Start the underlying service's pooled browsers."""
+        self.edevlet_service.warm_up()
+    
+    def close(self) -> None:
+        """Quit the browsers held by the underlying service."""
+        self.edevlet_service.close()
 
 
 def load_environment():
     """Load environment variables with defaults."""
+    # A deploy-time compiled .env replaces parsing it. Otherwise production gets its
+    # environment from the platform and .env is a development convenience
+    # (load_dotenv looks for it from src/ upwards and does nothing if it is missing)
+    if not load_compiled_env() and os.environ.get("ENVIRONMENT", "development") != "production":
+        from dotenv import load_dotenv
+        load_dotenv()
+    
     defaults = {
         "FLASK_HOST": "127.0.0.1",
         "FLASK_PORT": "5002",
@@ -70,8 +105,6 @@ def load_environment():
         "SQLITE_DB_PATH": "data/events.db",
         "LOG_LEVEL": "INFO",
         "LOG_FILE": "logs/edevlet_service.log",
-        "BACKEND_BASE_URL": "https://api.example.com",
-        "BACKEND_TIMEOUT": "30",
         "SCHEDULE_INTERVAL_HOURS": "2",
         "EDEVLET_USERNAME": "",
         "EDEVLET_PASSWORD": "",
@@ -83,8 +116,10 @@ def load_environment():
     
     # Set defaults if not present
     for key, value in defaults.items():
-        if key not in os.environ:
-            os.environ[key] = value
+        os.environ.setdefault(key, value)
+    
+    # Config read before this point must not keep serving the old environment
+    AppConfig.reload()
 
 def setup_services():
     """Initialize all services."""
@@ -95,18 +130,22 @@ def setup_services():
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     event_repo = SqliteEventRepository(db_path)
     
-    # Backend notifier
-    backend_notifier = BackendIntegrationService(
-        base_url=os.getenv("BACKEND_BASE_URL", "https://api.example.com"),
-        email=os.getenv("BACKEND_EMAIL", ""),
-        password=os.getenv("BACKEND_PASSWORD", ""),
-        timeout=int(os.getenv("BACKEND_TIMEOUT", "30"))
+    # Backend notifier (BACKEND_API_* variables, as documented in env.template),
+    # shared process-wide and closed at exit
+    backend_config = AppConfig.get_backend_config()
+    backend_notifier = BackendIntegrationService.get_shared(
+        base_url=backend_config["base_url"],
+        email=backend_config["email"],
+        password=backend_config["password"],
+        timeout=backend_config["timeout"],
+        pool_maxsize=backend_config["pool_size"],
+        notify_workers=backend_config["notify_workers"]
     )
     
     # Document validator (real edevlet service with adapter)
     edevlet_service = EdevletService(
-        headless=os.getenv("EDEVLET_HEADLESS", "true").lower() == "true",
-        timeout=int(os.getenv("EDEVLET_TIMEOUT", "60"))
+        headless=env_bool("EDEVLET_HEADLESS", True),
+        timeout=env_int("EDEVLET_TIMEOUT", 60)
     )
     document_validator = EdevletServiceAdapter(edevlet_service)
     
@@ -114,18 +153,31 @@ def setup_services():
     
     return event_repo, backend_notifier, document_validator
 
-def create_flask_app(event_repo, backend_notifier, document_validator):
+def create_flask_app(event_repo, verification_service, batch_size):
     """Create and configure Flask application."""
     app = Flask(__name__)
     CORS(app)
     
+    # Optional client allowlist (ALLOWED_IPS), parsed once by AppConfig
+    security_config = AppConfig.get_security_config()
+    allowed_ips = security_config["allowed_ips"]
+    allowed_networks = security_config["allowed_networks"]
+    if allowed_ips or allowed_networks:
+        @app.before_request
+        def restrict_client_ip():
+            remote_addr = request.remote_addr
+            if remote_addr in allowed_ips:
+                return None
+            
+            try:
+                client = ipaddress.ip_address(remote_addr)
+            except ValueError:
+                client = None
+            if client is None or not any(client in network for network in allowed_networks):
+                return jsonify({'success': False, 'error': 'Forbidden'}), 403
+    
     # Use cases
     receive_event_use_case = ReceiveEventUseCase(event_repo)
-    process_document_use_case = ProcessDocumentUseCase(
-        event_repo, 
-        document_validator, 
-        backend_notifier
-    )
     
     @app.route('/health', methods=['GET'])
     def health_check():
@@ -176,12 +228,18 @@ def create_flask_app(event_repo, backend_notifier, document_validator):
     @app.route('/api/process', methods=['POST'])
     def manual_process():
         try:
-            events = event_repo.find_pending_events()
-            processed = 0
+            # Claimed batch by batch and verified in parallel; each batch's
+            # status writes are flushed before its notifications go out
+            result = verification_service.process_all_pending_events(batch_size)
+            processed = result["processed_count"]
             
-            for event in events:
-                process_document_use_case.execute(event)
-                processed += 1
+            errors = result["status_write_errors"] + ([] if result["success"] else [result["message"]])
+            if errors:
+                return jsonify({
+                    'success': False,
+                    'processed': processed,
+                    'error': "; ".join(errors)
+                }), 500
             
             return jsonify({
                 'success': True,
@@ -198,43 +256,46 @@ def create_flask_app(event_repo, backend_notifier, document_validator):
     
     return app
 
-def setup_background_processing(event_repo, document_validator, backend_notifier):
+def setup_background_processing(verification_service, batch_size):
     """Setup background scheduler for automatic processing."""
-    process_document_use_case = ProcessDocumentUseCase(
-        event_repo, 
-        document_validator, 
-        backend_notifier
-    )
-    
     def process_pending_events():
         """Background job to process pending events."""
         logger = logging.getLogger(__name__)
-        events = event_repo.find_pending_events()
+        # Claiming marks the events as processing, so /api/process and this
+        # job cannot pick up the same events concurrently
+        result = verification_service.process_all_pending_events(batch_size)
         
-        if not events:
+        if not result["success"]:
+            logger.error(f"💥 Background processing stopped: {result['message']}")
+        elif not result["processed_count"]:
             logger.info("📭 No pending events to process")
             return
-            
-        logger.info(f"📊 Processing {len(events)} pending events")
         
-        for event in events:
-            try:
-                process_document_use_case.execute(event)
-            except Exception as e:
-                logger.error(f"Error processing event {event.id}: {e}")
+        for error in result["status_write_errors"]:
+            logger.error(f"💥 {error}")
+        logger.info(
+            "📊 Processed %s pending events (%s successful, %s failed)",
+            result["processed_count"], result["successful_count"], result["failed_count"]
+        )
     
     scheduler = BackgroundScheduler()
-    interval_hours = int(os.getenv("SCHEDULE_INTERVAL_HOURS", "2"))
+    interval_hours = env_int("SCHEDULE_INTERVAL_HOURS", 2)
     scheduler.schedule_job(process_pending_events, interval_hours)
     
     return scheduler
 
-def setup_signal_handlers(scheduler):
+def setup_signal_handlers(scheduler, document_validator, write_queue):
     """Setup signal handlers for graceful shutdown."""
     def signal_handler(signum, frame):
         logger = logging.getLogger(__name__)
         logger.info(f"🛑 Received signal {signum}, shutting down gracefully...")
         scheduler.stop()
+        try:
+            write_queue.flush()
+        except StatusWriteError as e:
+            logger.error(f"💥 {e}")
+        # Quit pooled Chrome processes so they don't outlive the service
+        document_validator.close()
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
@@ -250,30 +311,84 @@ def main():
     logger = logging.getLogger(__name__)
     
     try:
+        # Fail at startup, not on the first backend call, when credentials are missing
+        if AppConfig.is_required_validation_enabled():
+            missing = AppConfig.get_missing_required()
+            if missing:
+                raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+        AppConfig.preload()
+        
         # Initialize services
         event_repo, backend_notifier, document_validator = setup_services()
         
+        # Successful verifications are reused for repeated document/identity pairs
+        processing_config = AppConfig.get_processing_config()
+        verification_cache = None
+        if processing_config["verification_cache_size"] > 0:
+            verification_cache = VerificationCache(
+                maxsize=processing_config["verification_cache_size"],
+                ttl=processing_config["verification_cache_ttl"]
+            )
+        
+        # Event status updates are batched by a background writer
+        write_queue = RepositoryWriteQueue(event_repo)
+        
+        # One use case shared by the API and the background processor
+        process_document_use_case = ProcessDocumentUseCase(
+            event_repo, 
+            document_validator, 
+            backend_notifier,
+            verification_cache,
+            write_queue,
+            CircuitBreaker(
+                failure_threshold=processing_config["circuit_breaker_threshold"],
+                reset_timeout=processing_config["circuit_breaker_reset_seconds"]
+            )
+        )
+        
+        # Batches are verified in parallel, one pooled browser per worker;
+        # workers beyond the pool size would only wait for a free browser
+        verify_workers = max(1, min(
+            processing_config["verify_workers"],
+            AppConfig.get_browser_config()["pool_size"]
+        ))
+        verification_service = DocumentVerificationApplicationService(
+            event_repo,
+            ReceiveEventUseCase(event_repo),
+            process_document_use_case,
+            max_workers=verify_workers,
+            write_queue=write_queue
+        )
+        batch_size = max(processing_config["batch_size"], verify_workers)
+        
+        # Start the pooled browsers before the first batch needs them
+        try:
+            document_validator.warm_up()
+        except Exception as e:
+            logger.warning(f"⚠️ Browser warm-up failed, browsers start on first use: {e}")
+        
         # Setup background processing
-        scheduler = setup_background_processing(event_repo, document_validator, backend_notifier)
+        scheduler = setup_background_processing(verification_service, batch_size)
         scheduler.start()
         
         # Setup signal handlers
-        setup_signal_handlers(scheduler)
+        setup_signal_handlers(scheduler, document_validator, write_queue)
         
         # Create Flask app
-        app = create_flask_app(event_repo, backend_notifier, document_validator)
+        app = create_flask_app(event_repo, verification_service, batch_size)
         
         # Start Flask app
         host = os.getenv("FLASK_HOST", "127.0.0.1")
-        port = int(os.getenv("FLASK_PORT", "5002"))
-        debug = os.getenv("FLASK_DEBUG", "false").lower() == "true"
+        port = env_int("FLASK_PORT", 5002)
+        debug = env_bool("FLASK_DEBUG", False)
         
         logger.info(f"🌐 Flask API starting on {host}:{port}")
         logger.info(f"📅 Background processing every {os.getenv('SCHEDULE_INTERVAL_HOURS', '2')} hours")
         logger.info(f"📝 Logs: {os.getenv('LOG_FILE', 'logs/edevlet_service.log')}")
         logger.info("✅ Service ready!")
         
-        app.run(host=host, port=port, debug=debug)
+        # Threaded server: each request thread checks out its own pooled browser
+        app.run(host=host, port=port, debug=debug, threaded=True)
         
     except Exception as e:
         logger.error(f"❌ Failed to start service: {e}")